@@ -3,24 +3,15 @@
 # the number 23 is prime, and its digits sum to 5 (2+3), which is also prime. Your job is
 # to print all such numbers between the given input range.
 
-n,m = map(int,input().split())
+# Sieved range query shared with 08_Python_practice_02/10_QDay2.py
+import os
+import sys
 
-def is_prime(num):
-    if num<2:
-        return False
-    elif num>2:
-        for i in range(2,int(num**0.5)+1):
-            if(num%i==0):
-                return False
-    return True
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '08_Python_practice_02'))
+from solvers import digit_sum_primes
+from solvers.fastio import OutputWriter
 
-for num in range(n,m+1):
-    if(is_prime(num)):
-        digit_sum = sum(int(d) for d in str(num))
-        # Alternate way :- 
-        # digit_sum = 0
-        # for d in str(num):
-        #     digit_sum += int(d)
-        if(is_prime(digit_sum)):
-            print(num)
+n,m = map(int,input().split())
 
+with OutputWriter() as out:
+    out.each(digit_sum_primes(n, m), end='\n')
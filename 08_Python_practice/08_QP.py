@@ -1,16 +1,17 @@
 
-# Input
-n = int(input())                     # Number of levels
-levels = list(map(int, input().split()))  # Order in which levels are launched
+# Longest increasing subsequence of the level order, O(n log n)
+# (patience sorting, see 08_Python_practice_02/solvers/lis.py)
+import os
+import sys
 
-# Initialize LIS array (each element can be a sequence of length 1)
-lis = [1] * n
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '08_Python_practice_02'))
+from solvers.fastio import InputReader
+from solvers.lis import lis_length
 
-# Build LIS values
-for i in range(1, n):               # start from 2nd element
-    for j in range(0, i):           # check all elements before i
-        if levels[i] > levels[j]:   # if increasing
-            lis[i] = max(lis[i], lis[j] + 1)
+# Input
+reader = InputReader()
+n = reader.read_int()                # Number of levels
+levels = reader.ints_line()          # Order in which levels are launched
 
 # Answer is the max LIS length
-print(max(lis))
+print(lis_length(levels))
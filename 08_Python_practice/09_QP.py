@@ -1,27 +1,19 @@
-# Function to check if a string is palindrome
-def is_palindrome(s):
-    return s == s[::-1]
+# Divide a string into 3 palindromes, or print "Impossible".
+# Every split is checked in O(1) against one Manacher radius table
+# (08_Python_practice_02/solvers/palindromes.py).
+import os
+import sys
 
-# Function to divide the string into 3 palindromes
-def three_palindromes(word):
-    n = len(word)
-
-    # Try every possible way to split into 3 parts
-    for i in range(1, n - 1):
-        first = word[:i]
-        if is_palindrome(first):
-            for j in range(i + 1, n):
-                second = word[i:j]
-                third = word[j:]
-                if is_palindrome(second) and is_palindrome(third):
-                    # Print the three palindromes
-                    print(first)
-                    print(second)
-                    print(third)
-                    return
-    print("Impossible")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '08_Python_practice_02'))
+from solvers.palindromes import three_palindromes
 
 # -------------------------------
 # 🔹 Input section (TCS format)
 word = input().strip()
-three_palindromes(word)
+parts = three_palindromes(word)
+if parts is None:
+    print("Impossible")
+else:
+    # Print the three palindromes
+    for part in parts:
+        print(part)
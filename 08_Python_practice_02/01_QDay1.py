@@ -1,20 +1,12 @@
 # Majority Element
 
-arr = list(map(int,input().split()))
-n = len(arr)
-freq = {}
+from solvers import majority_elements
+from solvers.fastio import InputReader
 
-for num in arr:
-    if num in freq:
-        freq[num] +=1
-    else:
-        freq[num] =1
+arr = InputReader().ints_line()
+majority = majority_elements(arr, 3)
 
-found = False
-
-for key in freq:
-    if freq[key]> n//3:
-        print(key,end=' ')
-        found = True
-if not found:
+for key in majority:
+    print(key,end=' ')
+if not majority:
     print(' No Majority')
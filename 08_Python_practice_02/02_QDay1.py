@@ -25,12 +25,8 @@
 
 # sol 2:- 
 
-from collections import Counter
+from solvers import sum_of_unique
+from solvers.fastio import InputReader
 
-
-arr = list(map(int,input().split()))
-freq = Counter(arr)
-
-sum_unique = sum(k for k,v in freq.items() if v==1)
-
-print(sum_unique)
+arr = InputReader().ints_line()
+print(sum_of_unique(arr))
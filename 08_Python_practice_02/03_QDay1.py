@@ -1,9 +1,8 @@
 # Missing Number 
 
+from solvers import missing_number
+
 N=int(input("Enter Count N : "))
 arr = list(map(int,input("Enter space-separated elements: ").split()))
-
-actual_sum = (N*(N+1))/2
-given_sum = sum(arr)
-print(int(actual_sum-given_sum))
+print(missing_number(N, arr))
 1
\ No newline at end of file
@@ -12,15 +12,12 @@
 # 1 Three Five ThreeFive 16
 
 
-n = int(input())                    # number of elements
-arr = list(map(int, input().split()))  # list of numbers
+from solvers import fizz_buzz
+from solvers.fastio import InputReader, OutputWriter
 
-for num in arr:
-    if num % 3 == 0 and num % 5 == 0:
-        print("ThreeFive", end=" ")
-    elif num % 3 == 0:
-        print("Three", end=" ")
-    elif num % 5 == 0:
-        print("Five", end=" ")
-    else:
-        print(num, end=" ")
+reader = InputReader()
+n = reader.read_int()                 # number of elements
+arr = reader.ints_line()              # list of numbers
+
+with OutputWriter() as out:
+    out.each(fizz_buzz(arr), end=" ")
@@ -22,17 +22,22 @@
 # David: 90
 # Eva: 88
 
-K,N = map(int,(input().split()))
-students = []
+import sys
+from itertools import islice
 
-for _ in range(N):
-    marks,name = input().split()
-    students.append((int(marks),name))
+from solvers import top_k_students
 
-students.sort(reverse=True)
+K,N = map(int,(sys.stdin.buffer.readline().split()))
 
-for i in range(K):
-    print(f"{students[i][1]}:{students[i][0]}")
+# Streamed: only the K best students are kept. Names stay bytes until
+# printed; UTF-8 bytes compare in the same order as the decoded strings.
+def read_students(lines):
+    for line in lines:
+        marks, name = line.split()
+        yield int(marks), name
+
+for marks, name in top_k_students(read_students(islice(sys.stdin.buffer, N)), K):
+    print(f"{name.decode()}:{marks}")
 
 
 # students.sort(key=lambda x: (-x[0], x[1])) --> remember 
@@ -14,18 +14,11 @@
 # 👉 If no character meets the condition, print nothing (empty output).
 
 
-from collections import Counter
+from solvers import first_char_with_frequency
 
 s = input().strip()
 p = int(input())
 
-freq = Counter(s)
-
-candidates = [ch for ch,count in freq.items() if count>=p]
-
-ans = min(candidates)
-
-for ch in s:
-    if ch==ans:
-        print(ch)
-        break
+ans = first_char_with_frequency(s, p)
+if ans is not None:
+    print(ans)
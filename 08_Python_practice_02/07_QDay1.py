@@ -5,18 +5,15 @@
 # because 13+53+33
 # =153.
 
-arr = list(map(int,input().split()))
-found = False
-for num in arr:
-    digits = str(num)
-    power = len(digits)
-    arm = sum(int(d)**power for d in digits)
-    if(num==arm):
-        print(num,end=" ")
-        found= True
-    
-if not found:
-    print("No armstrong Number")
+from solvers import armstrong_numbers
+from solvers.fastio import InputReader, OutputWriter
+
+arr = InputReader().ints_line()
+found = armstrong_numbers(arr)
+with OutputWriter() as out:
+    out.each(found, end=" ")
+    if not found:
+        out.line("No armstrong Number")
 
 
 
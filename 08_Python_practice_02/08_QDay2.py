@@ -15,12 +15,10 @@
 # compared to the correct time.
 
 
+from solvers import watch_difference
+
 h,m = map(int,input().split())
 h1,m1 = map(int,input().split())
 x = int(input())
 
-correct_time = (h*60+x*60)+m
-new_watch_time = (h1*60)+m1
-
-time_diff = -(new_watch_time-correct_time)
-print(time_diff)
\ No newline at end of file
+print(watch_difference(h, m, h1, m1, x))
\ No newline at end of file
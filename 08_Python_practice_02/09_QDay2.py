@@ -17,14 +17,7 @@
 # Take absolute value (so it’s always positive)
 
 
-N = int(input())
-product_N = 1
-sum_N = 0
-
-digit = str(N)
-for d in digit:
-    product_N = product_N*int(d)
-    sum_N = sum_N+int(d)
+from solvers import product_sum_difference
 
-ans = abs(product_N-sum_N)
-print(ans)
+N = int(input())
+print(product_sum_difference(N))
@@ -8,22 +8,9 @@
 
 
 
-def Isprime(N):
-    if N<1:
-        return False
-    elif N==1:
-        return False
-    elif N==2:
-        return True
-    
-    for i in range(2,int((N**(0.5)))+1):
-            if(N%i==0):
-                return False
-    return True
+from solvers import digit_sum_primes
+from solvers.fastio import OutputWriter
 
 n,m = map(int,input().split())
-for num in range(n,m+1):
-    if Isprime(num):
-        sum_d = sum(int(d) for d in str(num))
-        if(Isprime(sum_d)):
-            print(num,end=' ')
+with OutputWriter() as out:
+    out.each(digit_sum_primes(n, m), end=' ')
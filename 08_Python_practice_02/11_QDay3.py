@@ -8,38 +8,14 @@
 # to reach the bottom-right corner (m-1, n-1).
 # --------------------------------------------
 
-# ✅ Step 1: Take inputs
-# m = number of rows
-# n = number of columns
+# m = number of rows, n = number of columns
+# ways[i][j] = ways[i-1][j] + ways[i][j-1] works out to C(m+n-2, m-1),
+# which is what unique_paths() computes.
 
-m, n = map(int, input().split())
-
-# ✅ Step 2: Create a 2D DP table (list of lists)
-# ways[i][j] will store how many unique paths reach cell (i, j)
-
-ways = [[0] * n for _ in range(m)]
-
-# ✅ Step 3: Base Case Initialization
-# First row → only 1 way (go right)
-# First column → only 1 way (go down)
-
-for i in range(m):
-    ways[i][0] = 1       # 1 way to move straight down
-for j in range(n):
-    ways[0][j] = 1       # 1 way to move straight right
+from solvers import unique_paths
 
-# ✅ Step 4: Fill the DP table using relation:
-# ways[i][j] = ways[i-1][j] + ways[i][j-1]
-# (paths from top + paths from left)
-
-for i in range(1, m):
-    for j in range(1, n):
-        ways[i][j] = ways[i-1][j] + ways[i][j-1]
-
-# ✅ Step 5: The bottom-right cell (m-1, n-1)
-# contains the total number of unique paths
-
-print(ways[m-1][n-1])
+m, n = map(int, input().split())
+print(unique_paths(m, n))
 
 # --------------------------------------------
 # ✅ Example:
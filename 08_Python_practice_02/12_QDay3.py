@@ -4,6 +4,7 @@
 # Given two integers L and R,
 # find the sum of cubes of all numbers between L and R (both inclusive).
 
+from solvers import cube_sum
+
 L,R = map(int,input().split())
-ans = sum(i**3 for i in range(L,R+1))
-print(ans)
\ No newline at end of file
+print(cube_sum(L, R))
\ No newline at end of file
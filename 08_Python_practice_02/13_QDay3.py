@@ -9,14 +9,14 @@
 # 3️⃣ The highest sale
 # 4️⃣ The lowest sale
 
-N = int(input())
-sales_amt = list(map(int,input().split()))
+from solvers import sales_summary
+from solvers.fastio import InputReader
 
+reader = InputReader()
+N = reader.read_int()
+sales_amt = reader.ints_line()
 
-Total_sales = sum(sales_amt)
-Avg_sales = Total_sales/N
-Highest_sale = max(sales_amt)
-Lowest_sale = min(sales_amt)
+Total_sales, Avg_sales, Highest_sale, Lowest_sale = sales_summary(sales_amt)
 print(f'Total: {Total_sales}')
 print(f'Avearge: {Avg_sales}')
 print(f'Highest: {Highest_sale}')
@@ -5,9 +5,10 @@
 # you need to print its multiplication table from 1 to 10,
 # and at the end, print the sum of all products.
 
+from solvers import multiplication_table
+
 N = int(input())
-Total = 0
-for i in range(1,11):
-    Total = sum(N*i for i in range(1,11))
-    print(f'{N}X{i} = {N*i}')
+rows, Total = multiplication_table(N)
+for i, product in rows:
+    print(f'{N}X{i} = {product}')
 print(Total)
\ No newline at end of file
@@ -5,14 +5,11 @@
 # you have to find how many distinct values you can get
 # by performing bitwise OR on all possible subarrays of that array.
 
-n = int(input())
-arr = list(map(int,input().split()))
-unique_Or = set()
+from solvers import subarray_ors
+from solvers.fastio import InputReader
 
-for i in range(n):
-    curr_or = 0
-    for j in range(i,n):
-        curr_or = curr_or | arr[j]
-        unique_Or.add(curr_or)
-print(len(unique_Or))
+reader = InputReader()
+n = reader.read_int()
+arr = reader.ints_line()
+print(len(subarray_ors(arr)))
 
@@ -1,11 +1,11 @@
 # Printing Subarray:-
 
-arr = list(map(int,input().split()))
-n = len(arr)
-for i in range(n):
-    for j in range(i,n):
-        subarray = arr[i:j+1]
-        print(subarray)
+from solvers import subarray_texts
+from solvers.fastio import OutputWriter, parse_ints
+
+arr = parse_ints(input())
+with OutputWriter() as out:
+    out.each(subarray_texts(arr), end='\n')
 
 # # Input
 # n = int(input())
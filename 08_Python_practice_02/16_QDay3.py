@@ -22,4 +22,6 @@
 #         result = result+ch
 # print(result)
 
-print(input().strip().swapcase())
\ No newline at end of file
+from solvers import swap_case
+
+print(swap_case(input().strip()))
\ No newline at end of file
@@ -15,19 +15,8 @@
 # If the shift goes past 'z' or '9', wrap around (circular shift).
 
 
+from solvers import shift_chars
+
 S = input().strip()
 K = int(input())
-
-result = ""
-
-for ch in S :
-    if 'A'<=ch<='Z':
-        shift = chr((ord(ch)-ord('A')+K)%26+ord('A'))
-    elif 'a'<=ch<='z':
-        shift = chr((ord(ch)-ord('a')+K)%26+ord('a'))
-    elif '0'<=ch<='9':
-        shift = chr((ord(ch) - ord('0') + K) % 10 + ord('0'))
-    else:
-        shift = ch
-    result = result+shift
-print(result)
\ No newline at end of file
+print(shift_chars(S, K))
\ No newline at end of file
@@ -7,9 +7,9 @@
 # 2️⃣ Once in descending (Z–A) order
 
 
+from solvers import sort_words
+
 S = input().strip()
-words = S.split()
-asc = sorted(words)
-desc = sorted(words,reverse=True)
+asc, desc = sort_words(S.split())
 print("Ascneding: ",' '.join(asc))
 print("Descending: ",' '.join(desc))
@@ -7,9 +7,7 @@
 # 2️⃣ Compute their average,
 # 3️⃣ Print that average value (as an integer).
 
-S= input().strip()
+from solvers import ascii_average
 
-Ascii = sum(ord(ch)for ch in S)
-N = len(S)
-avg = Ascii//N
-print((avg))
+S= input().strip()
+print(ascii_average(S))
@@ -6,11 +6,10 @@
 # ✅ Ignore case (uppercase and lowercase treated same).
 # ✅ Ignore spaces, digits, and special symbols.
 
-S = input().strip().lower()
-all_letters = set('abcdefghijklmnopqrstuvwxyz')
-letters_in_S = {ch for ch in S if ch.isalpha()}
-missing = sorted(all_letters-letters_in_S)
+from solvers import missing_letters
+
+missing = missing_letters(input().strip())
 if len(missing) == 0:
     print("None")
 else:
-    print(''.join(missing))
\ No newline at end of file
+    print(missing)
\ No newline at end of file
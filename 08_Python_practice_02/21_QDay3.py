@@ -1,7 +1,9 @@
 # 🔹 Q21 — Palindrome Check
 
+from solvers import is_palindrome
+
 S = input().strip().lower()
-if S == S[::-1]:
+if is_palindrome(S):
     print("Palindrome")
 else:
     print("Not Palindrome")
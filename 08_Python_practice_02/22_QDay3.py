@@ -4,9 +4,11 @@
 # listen → silent
 # triangle → integral
 
-S1 = sorted(input().strip().lower())
-S2 = sorted(input().strip().lower())
-if(S1==S2):
+from solvers import is_anagram
+
+S1 = input().strip()
+S2 = input().strip()
+if is_anagram(S1, S2):
     print("Anagram")
 else:
     print("not Anagram")
@@ -1,13 +1,10 @@
 #🔹 Q23 — Count Palindromic Substrings
 
-S = input()
-n = len(S)
-count = 0
-for i in range(n):
-    for j in range(i,n):
-        substr = S[i:j+1]
-        if(substr==substr[::-1]):
-            print(substr)
-            count +=1
-print(count)
+from solvers.fastio import OutputWriter
+from solvers.palindromes import Palindromes
 
+S = input()
+palindromes = Palindromes(S)        # Manacher radii, built once
+with OutputWriter() as out:
+    out.each(palindromes.substrings(), end='\n')
+    out.line(palindromes.count())
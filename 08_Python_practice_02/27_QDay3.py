@@ -4,7 +4,7 @@
 # Given a sentence, reverse the order of the words,
 # but don’t reverse the characters inside the words.
 
+from solvers import reverse_words
+
 S = input().strip()
-words = S.split()
-reversed_words = words[::-1]
-print(' '.join(reversed_words))
\ No newline at end of file
+print(reverse_words(S))
\ No newline at end of file
@@ -1,15 +1,7 @@
 # Count Frequency:-
 
-S = input().strip().lower()
-freq={}
-for ch in S:
-    if ch==' ':
-        continue
-    if ch in freq:
-        freq[ch]+=1
-    else:
-        freq[ch]=1
-
+from solvers import char_frequency
 
-for i,v in sorted(freq.items()):
+S = input().strip().lower()
+for i,v in char_frequency(S):
     print(i,v)
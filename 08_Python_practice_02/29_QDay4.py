@@ -11,29 +11,17 @@
 #             print((i,j),end=' ')
 
 
-from collections import defaultdict
+# Prefix sums: a subarray (start, i) sums to target when
+# prefix[i] - prefix[start - 1] == target.
 
-arr = list(map(int, input().split()))
-target = int(input())
+from solvers.fastio import InputReader, OutputWriter
+from solvers.prefix_sums import PrefixIndex
 
-prefix_map = defaultdict(list)   # stores prefix_sum -> [indices]
-curr_sum = 0
-results = []
+reader = InputReader()
+arr = reader.ints_line()
+target = reader.read_int()
 
-for i in range(len(arr)):
-    curr_sum += arr[i]
-
-    # Case 1: subarray starts from index 0
-    if curr_sum == target:
-        results.append((0, i))
-
-    # Case 2: check if there's a previous prefix that makes target
-    need = curr_sum - target
-    if need in prefix_map:
-        for start in prefix_map[need]:
-            results.append((start + 1, i))
-
-    # Store current prefix sum for future use
-    prefix_map[curr_sum].append(i)
-
-print(results)
+# Same text as print(list_of_pairs), written as the pairs are found
+with OutputWriter() as out:
+    out.write('[')
+    out.values(PrefixIndex(arr).pairs(target), sep=', ', end=']\n')
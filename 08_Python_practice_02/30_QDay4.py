@@ -1,29 +1,14 @@
 # 🧩 Q — Check if there exists a Subarray with Sum = 0
 
-arr = list(map(int, input().split()))
-n = len(arr)
+# A prefix sum that is 0 or repeats an earlier one means the elements in
+# between sum to 0.
 
-prefix_sum = 0
-seen = set()        # to store all prefix sums seen so far
-found = False       # flag to mark if we find a 0-sum subarray
+from solvers import has_zero_sum_subarray
+from solvers.fastio import InputReader
 
-for i in range(n):
-    prefix_sum += arr[i]     # add current element
+arr = InputReader().ints_line()
 
-    # Case 1: subarray from start
-    if prefix_sum == 0:
-        found = True
-        break
-
-    # Case 2: prefix_sum seen before (means in between sum became 0)
-    if prefix_sum in seen:
-        found = True
-        break
-
-    # Case 3: store prefix_sum for later checks
-    seen.add(prefix_sum)
-
-if found:
+if has_zero_sum_subarray(arr):
     print("Yes")
 else:
     print("No")
@@ -11,25 +11,22 @@
 
 import sys
 
-names = []          # stores names with age > 20
-female_grades = []  # stores grades of all female students
+from solvers import data_query
 
-for line in sys.stdin:
-    name, age, gender, grade = line.strip().split()
-    age = int(age)
-    grade = float(grade)
 
-    if age > 20:
-        names.append(name)
-    if gender.lower() == "female":
-        female_grades.append(grade)
+def read_records(lines):
+    for line in lines:
+        name, age, gender, grade = line.strip().split()
+        yield name, int(age), gender, float(grade)
+
+
+names, avg = data_query(read_records(sys.stdin))
 
 # Output 1: names whose age > 20
 print(" ".join(names))
 
 # Output 2: average of female grades (rounded to 2 decimals)
-if female_grades:
-    avg = sum(female_grades) / len(female_grades)
+if avg is not None:
     print(f"{avg:.2f}")
 else:
     print("0.00")
@@ -16,26 +16,16 @@
 # If all differences are unique → print "non"
 
 
-from collections import Counter
+from solvers import most_frequent_difference
+from solvers.fastio import InputReader
 
-n = int(input())
-heights = list(map(int, input().split()))
+reader = InputReader()
+n = reader.read_int()
+heights = reader.ints_line()
 
-# Check for invalid case
-if any(h < 0 for h in heights):
+try:
+    diff = most_frequent_difference(heights)
+except ValueError:
     print("invalid")
 else:
-    # Step 1: Find adjacent absolute differences
-    diffs = [abs(heights[i] - heights[i+1]) for i in range(n-1)]
-    
-    # Step 2: Count frequency of each difference
-    freq = Counter(diffs)
-    
-    # Step 3: Find most frequent difference
-    most_common = freq.most_common(1)[0][1]  # get highest frequency
-    
-    if most_common == 1:
-        print("non")
-    else:
-        # find the first difference that has this highest frequency
-        print(freq.most_common(1)[0][0] ) 
\ No newline at end of file
+    print("non" if diff is None else diff)
\ No newline at end of file
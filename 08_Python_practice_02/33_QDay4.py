@@ -7,23 +7,10 @@
 # Distinct = duplicates are not counted again.
 # e.g., "AAB" → total 3 unique permutations (AAB, ABA, BAA)
 
-from math import factorial
-from collections import Counter
+# Formula: n! / (c1! * c2! * ...) where c1, c2, ... are the counts of
+# each character.
 
-s = input().strip()
-
-# Step 1: total characters
-n = len(s)
-
-# Step 2: frequency count of each character
-freq = Counter(s)
+from solvers import distinct_permutation_count
 
-# Step 3: compute denominator = product of factorials of frequencies
-denominator = 1
-for count in freq.values():
-    denominator *= factorial(count)
-
-# Step 4: apply formula
-ans = factorial(n) // denominator
-
-print(ans)
+s = input().strip()
+print(distinct_permutation_count(s))
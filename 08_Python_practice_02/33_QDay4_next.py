@@ -8,13 +8,9 @@
 # e.g., "AAB" → total 3 unique permutations (AAB, ABA, BAA)
 # print values also 
 
-from itertools import permutations
+from solvers import unique_permutations
 
 S = input().strip()
 
-perm = permutations(S)
-
-unique = sorted(set([''.join(p) for p in perm]))
-
-for p in unique:
+for p in unique_permutations(S):
     print(p)
\ No newline at end of file
@@ -19,18 +19,10 @@
 # You can use Python’s set() to remove duplicates.
 
 
-# Step 1: Take input
-words = input().split()
-
-# Step 2: Remove duplicates
-unique_words = set(words)
+from solvers import unique_words_sorted
 
-# Step 3: Sort ascending
-asc = sorted(unique_words)
-
-# Step 4: Sort descending
-desc = sorted(unique_words, reverse=True)
+words = input().split()
+asc, desc = unique_words_sorted(words)
 
-# Step 5: Print
 print(" ".join(asc))
 print(" ".join(desc))
@@ -1,9 +1,6 @@
-from collections import Counter
-arr = list(map(int,input().split()))
-freq = Counter(arr)
+from solvers import sum_of_unique
+from solvers.fastio import InputReader
 
-ans = sum(num for num, count in freq.items() if count == 1)
-
-
-print(ans)
+arr = InputReader().ints_line()
+print(sum_of_unique(arr))
 
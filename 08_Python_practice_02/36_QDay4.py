@@ -1,13 +1,7 @@
 # Std Deviation of Array :- 
 
-arr = list(map(int,input().split()))
+from solvers import std_dev
+from solvers.fastio import InputReader
 
-n = len(arr)
-
-mean = sum(arr)/n
-
-std = sum((i-mean)**2 for i in arr)
-
-ans = (std/n)**0.5
-
-print(f'{ans:.2f}')
\ No newline at end of file
+arr = InputReader().ints_line()
+print(f'{std_dev(arr):.2f}')
\ No newline at end of file
@@ -7,10 +7,10 @@
 # LCM(8, 10) = 40
 # (because 40 is the first number divisible by both 8 and 10)
 
-import math
+# LCM(a, b) = a * b // GCD(a, b)
 
-a, b = map(int, input().split())
+from solvers import lcm
 
-lcm = (a * b) // math.gcd(a, b)
-print(lcm)
+a, b = map(int, input().split())
+print(lcm(a, b))
 
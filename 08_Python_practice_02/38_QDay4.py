@@ -17,22 +17,15 @@
 
 # If there’s a tie, print "No Winner"
 
-from collections import Counter
+import sys
+from itertools import chain
 
-n, m = map(int, input().split())
-votes = input().split()
+from solvers import vote_winner
+from solvers.fastio import iter_words
 
-# Step 1: Count frequency of votes
-freq = Counter(votes)
+n, m = map(int, sys.stdin.buffer.readline().split())
+# The votes line, streamed: only the per-candidate counts are kept
+votes = chain.from_iterable(iter_words(one_line=True))
 
-# Step 2: Find the maximum vote count
-max_votes = max(freq.values())
-
-# Step 3: Check how many have this max value
-winners = [name for name, count in freq.items() if count == max_votes]
-
-# Step 4: Decision
-if len(winners) > 1:
-    print("No Winner")
-else:
-    print(winners[0])
+winner = vote_winner(votes)
+print("No Winner" if winner is None else winner)
@@ -1,14 +1,12 @@
 # Q1 — Print Matrix in Normal Order
 
-n, m = list(map(int,input().split()))
-matrix = []
+from solvers.fastio import OutputWriter
+from solvers.matrix_ops import read_matrix
 
-for i in range(n):
-    row = list(map(int,input().split()))
-    matrix.append(row)
+matrix = read_matrix()
 
-for i in range(n):
-    for j in range(m):
-        print(matrix[i][j],end=' ')
-    print()
+with OutputWriter() as out:
+    for row in matrix:
+        out.each(row, end=' ')
+        out.write('\n')
 
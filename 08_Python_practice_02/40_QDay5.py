@@ -1,14 +1,13 @@
 # Q2 — Print Matrix Column-Wise
 
-n, m = list(map(int,input().split()))
-matrix = []
+from solvers import columns
+from solvers.fastio import OutputWriter
+from solvers.matrix_ops import read_matrix
 
-for i in range(n):
-    row = list(map(int,input().split()))
-    matrix.append(row)
+matrix = read_matrix()
 
-for j in range(m):
-    for i in range(n):
-        print(matrix[i][j],end=' ')
-    print()
+with OutputWriter() as out:
+    for column in columns(matrix):
+        out.each(column, end=' ')
+        out.write('\n')
 
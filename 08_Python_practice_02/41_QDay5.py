@@ -1,17 +1,8 @@
 # Sum of all elements in matrix :- 
 
-n,m = list(map(int,input().split()))
-matrix = []
+from solvers import total
+from solvers.matrix_ops import read_matrix
 
-for i in range(n):
-    rows = list(map(int,input().split()))
-    matrix.append(rows)
-    
-total = sum(sum(row)for row in matrix)
-    
+matrix = read_matrix()
 
- 
-# for i in range(n):
-#     for j in range(m):
-#         sum += matrix[i][j]
-print(total)
\ No newline at end of file
+print(total(matrix))
\ No newline at end of file
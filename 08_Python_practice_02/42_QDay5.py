@@ -1,15 +1,12 @@
 
 # 🧩 Q4 — Sum of Diagonals of a Square Matrix
 
-n,m = list(map(int,input().split()))
-matrix = []
+from solvers import diagonal_sums
+from solvers.matrix_ops import read_matrix
 
-for i in range(n):
-    rows = list(map(int,input().split()))
-    matrix.append(rows)
+matrix = read_matrix()
 
-Primary = sum(matrix[i][i] for i in range(n))
-Secondary = sum(matrix[i][n-i-1] for i in range(n))
+Primary, Secondary = diagonal_sums(matrix)
 
 print(Primary)
 print(Secondary)
\ No newline at end of file
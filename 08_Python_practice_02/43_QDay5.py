@@ -1,15 +1,10 @@
-m,n = list(map(int,input().split()))
-matrix = []
+# Snake order: even rows left to right, odd rows right to left
 
-for i in range(m):
-    rows = list(map(int,input().split()))
-    matrix.append(rows)
+from solvers import snake_order
+from solvers.fastio import OutputWriter
+from solvers.matrix_ops import read_matrix
 
-result = []
+matrix = read_matrix()
 
-for i in range(m):
-    if i%2==0:
-        result.extend(matrix[i])
-    else:
-        result.extend(matrix[i][::-1])
-print(*result)
+with OutputWriter() as out:
+    out.values(snake_order(matrix))
@@ -1,13 +1,8 @@
-m,n = list(map(int,input().split()))
-matrix = []
-minimum = 129761432
+# Minimum element of a matrix
 
-for i in range(m):
-    rows = list(map(int,input().split()))
-    matrix.append(rows)
+from solvers import minimum
+from solvers.matrix_ops import read_matrix
 
-for i in range(m):
-    for j in range(n):
-        minimum = min(minimum,matrix[i][j])
+matrix = read_matrix()
 
-print(minimum)
\ No newline at end of file
+print(minimum(matrix))
\ No newline at end of file
@@ -0,0 +1,29 @@
+# The practice problems as plain functions.
+#
+# The numbered scripts next to this package only parse stdin, call one of
+# these and print the answer; batch callers can import them directly and
+# skip the interpreter startup and the text round trip:
+#
+#   from solvers import majority_elements, vote_winner
+#   majority_elements([3, 3, 4, 2, 3])      # -> [3]
+#
+# Functions take plain lists / iterables and return values instead of
+# printing. The comment above each one names the script it comes from.
+
+from .counting import (char_frequency, first_char_with_frequency, majority_elements,
+                       most_frequent_difference, sum_of_unique, vote_winner)
+from .matrix_ops import (columns, diagonal_sums, minimum, read_matrix, row_major, snake_order,
+                         snake_rows, total)
+from .numbers import (armstrong_numbers, cube_sum, distinct_permutation_count, fizz_buzz,
+                      is_armstrong, is_prime, lcm, missing_number, multiplication_table,
+                      product_sum_difference, sales_summary, std_dev, unique_paths,
+                      watch_difference)
+from .records import data_query, top_k_students
+from .sieve import digit_sum, digit_sum_primes
+from .strings import (ascii_average, is_anagram, is_palindrome, longest_palindromic_word,
+                      longest_word, missing_letters, palindromic_substrings, reverse_words,
+                      run_length, shift_chars, sort_words, swap_case, unique_permutations,
+                      unique_words_sorted)
+from .subarrays import (distinct_subarray_values, has_zero_sum_subarray, subarray_ands,
+                        subarray_gcds, subarray_ors, subarray_texts, subarrays,
+                        target_sum_subarrays)
@@ -0,0 +1,70 @@
+# Frequency based problems.
+
+import operator
+from array import array
+from collections import Counter
+from itertools import islice
+
+from .frequency import misra_gries, mode, values_with_count
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# 01_QDay1: values seen more than len/k times, in first-seen order.
+# Misra-Gries narrows them down to k - 1 candidates, which a second pass
+# counts exactly, so no count of every distinct value is ever kept.
+def majority_elements(values, k=3):
+    if not hasattr(values, 'count'):
+        values = list(values)
+    candidates, n = misra_gries(values, k)
+    found = [value for value in candidates if values.count(value) > n // k]
+    return sorted(found, key=values.index)
+
+
+# 02_QDay1 / 35_QDay4: sum of the values that appear exactly once
+def sum_of_unique(values):
+    return sum(values_with_count(values, 1))
+
+
+# 06_QDay1: alphabetically smallest character seen at least p times, or None
+def first_char_with_frequency(text, p):
+    candidates = [ch for ch, count in Counter(text).items() if count >= p]
+    return min(candidates) if candidates else None
+
+
+# 28_QDay4: (character, count) pairs in character order, spaces skipped
+def char_frequency(text):
+    freq = Counter(text)
+    freq.pop(' ', None)
+    return sorted(freq.items())
+
+
+# 32_QDay1: most frequent absolute difference between neighbours, or None
+# when every difference is unique. Negative heights are invalid.
+def most_frequent_difference(heights):
+    if not hasattr(heights, '__len__'):
+        heights = list(heights)
+    if len(heights) and min(heights) < 0:
+        raise ValueError("heights must not be negative")
+    if numpy is not None and isinstance(heights, (array, numpy.ndarray)):
+        differences = numpy.abs(numpy.diff(numpy.asarray(heights)))
+    else:
+        differences = map(abs, map(operator.sub, heights, islice(heights, 1, None)))
+    best = mode(differences)
+    if best is None:
+        return None
+    value, count = best
+    return value if count > 1 else None
+
+
+# 38_QDay4: the candidate with the most votes, or None on a tie
+def vote_winner(votes):
+    freq = Counter(votes)
+    if not freq:
+        return None
+    max_votes = max(freq.values())
+    winners = [name for name, count in freq.items() if count == max_votes]
+    return winners[0] if len(winners) == 1 else None
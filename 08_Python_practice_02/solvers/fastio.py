@@ -0,0 +1,253 @@
+# Bulk stdin parsing for the numeric solvers.
+#
+#   from solvers.fastio import InputReader
+#   reader = InputReader()              # reads all of sys.stdin.buffer at once
+#   n, m = reader.ints_line()
+#   matrix = reader.matrix(n, m)        # n rows of array('q')
+#
+# Numbers are parsed a whole line (or the whole input) at a time into
+# array('q') / array('d') buffers: 8 bytes per value instead of ~32 for a
+# list of ints. With NumPy installed the text is parsed by
+# numpy.fromstring in C, which is where the speed-up is (~5-10x over
+# map(int, ...)); without it parsing falls back to map(int, ...) over bytes,
+# about as fast as input().split() but much smaller in memory.
+# A value that does not fit in 64 bits makes parse_ints() return a plain
+# list of Python ints instead (an object ndarray with as_numpy=True), so
+# big numbers come out exactly as int() would read them.
+#
+# For input larger than memory, iter_ints(), iter_words() and
+# iter_int_rows() read the stream in chunks / lines and yield one buffer at
+# a time.
+#
+# OutputWriter is the other direction: instead of one print() per value it
+# formats whole sequences with str.join and writes to stdout in large
+# chunks.
+#
+#   out = OutputWriter()
+#   out.each(words)                     # for w in words: print(w, end=' ')
+#   out.values(row)                     # print(*row)
+#   out.flush()                         # or use it as a context manager
+
+import re
+import sys
+from array import array
+from itertools import islice
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CHUNK_SIZE = 1 << 24
+WRITE_SIZE = 1 << 16       # characters buffered before a write
+BATCH = 4096               # values formatted per join
+WHITESPACE = (b' ', b'\n', b'\t', b'\r')
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+# 19 digits in a row: the only way a token can be outside int64
+LONG_NUMBER = re.compile(rb'\d{19}')
+LONG_NUMBER_TEXT = re.compile(r'\d{19}')
+
+
+def _exact_ints(data, as_numpy):
+    # The values as Python ints if any is outside int64, else None
+    values = list(map(int, data.split()))
+    if values and (min(values) < INT64_MIN or max(values) > INT64_MAX):
+        return numpy.array(values, dtype=object) if as_numpy else values
+    return None
+
+
+def parse_ints(data, as_numpy=False):
+    # bytes of whitespace separated integers -> array('q') (or ndarray);
+    # a list of Python ints when a value needs more than 64 bits.
+    if numpy is not None:
+        # fromstring saturates out-of-range values instead of failing, so
+        # text with a long enough number is checked with int() first.
+        pattern = LONG_NUMBER_TEXT if isinstance(data, str) else LONG_NUMBER
+        if pattern.search(data):
+            exact = _exact_ints(data, as_numpy)
+            if exact is not None:
+                return exact
+        values = numpy.fromstring(data, dtype=numpy.int64, sep=' ')
+        if as_numpy:
+            return values
+        result = array('q')
+        result.frombytes(values.tobytes())
+        return result
+    if as_numpy:
+        raise RuntimeError("as_numpy=True needs NumPy installed")
+    values = list(map(int, data.split()))
+    try:
+        return array('q', values)
+    except OverflowError:
+        return values
+
+
+def parse_floats(data, as_numpy=False):
+    if numpy is not None:
+        values = numpy.fromstring(data, dtype=numpy.float64, sep=' ')
+        if as_numpy:
+            return values
+        result = array('d')
+        result.frombytes(values.tobytes())
+        return result
+    if as_numpy:
+        raise RuntimeError("as_numpy=True needs NumPy installed")
+    return array('d', list(map(float, data.split())))
+
+
+class InputReader:
+    def __init__(self, stream=None):
+        if stream is None:
+            stream = sys.stdin.buffer
+        self.data = stream.read()
+        self.pos = 0
+
+    def readline(self):
+        # Next line without its newline; b'' at the end of input.
+        end = self.data.find(b'\n', self.pos)
+        if end < 0:
+            end = len(self.data)
+        line = self.data[self.pos:end].rstrip(b'\r')
+        self.pos = end + 1
+        return line
+
+    def read_int(self):
+        return int(self.readline())
+
+    def ints_line(self, as_numpy=False):
+        return parse_ints(self.readline(), as_numpy)
+
+    def floats_line(self, as_numpy=False):
+        return parse_floats(self.readline(), as_numpy)
+
+    def rest(self):
+        data = self.data[self.pos:]
+        self.pos = len(self.data)
+        return data
+
+    def ints(self, as_numpy=False):
+        # Every remaining integer, across lines.
+        return parse_ints(self.rest(), as_numpy)
+
+    def floats(self, as_numpy=False):
+        return parse_floats(self.rest(), as_numpy)
+
+    def matrix(self, rows, cols, as_numpy=False):
+        # The next rows * cols integers as a list of rows (a 2-D ndarray
+        # with as_numpy=True).
+        values = self.ints(as_numpy)
+        if len(values) < rows * cols:
+            raise ValueError(f"expected {rows}x{cols} values, got {len(values)}")
+        if as_numpy:
+            return values[:rows * cols].reshape(rows, cols)
+        return [values[i * cols:(i + 1) * cols] for i in range(rows)]
+
+
+def _chunks(stream, chunk_size, one_line=False):
+    # Blocks of about chunk_size bytes, cut at whitespace so no token is
+    # split; with one_line only up to the end of the current line.
+    if stream is None:
+        stream = sys.stdin.buffer
+    read = stream.readline if one_line else stream.read
+    tail = b''
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        chunk = tail + chunk
+        if one_line and chunk.endswith(b'\n'):
+            tail = chunk
+            break
+        cut = max(chunk.rfind(ws) for ws in WHITESPACE)
+        if cut < 0:            # one token longer than a chunk so far
+            tail = chunk
+            continue
+        tail = chunk[cut:]
+        yield chunk[:cut]
+    if tail.strip():
+        yield tail
+
+
+def iter_ints(stream=None, chunk_size=CHUNK_SIZE):
+    # Yield the integers of a stream as array('q') blocks of about
+    # chunk_size bytes of input each; memory stays O(chunk_size).
+    for chunk in _chunks(stream, chunk_size):
+        yield parse_ints(chunk)
+
+
+def iter_words(stream=None, chunk_size=CHUNK_SIZE, one_line=False):
+    # The same for whitespace separated words, as lists of str; one_line
+    # stops at the end of the current line.
+    for chunk in _chunks(stream, chunk_size, one_line):
+        yield chunk.decode().split()
+
+
+def iter_int_rows(stream=None):
+    # One array('q') per non-empty input line.
+    if stream is None:
+        stream = sys.stdin.buffer
+    for line in stream:
+        if line.strip():
+            yield parse_ints(line)
+
+
+def _batches(values):
+    if hasattr(values, 'tolist'):      # array / ndarray: convert in C
+        values = values.tolist()
+    it = iter(values)
+    while True:
+        batch = list(islice(it, BATCH))
+        if not batch:
+            return
+        yield batch
+
+
+class OutputWriter:
+    def __init__(self, stream=None, write_size=WRITE_SIZE):
+        self.stream = sys.stdout if stream is None else stream
+        self.write_size = write_size
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.write_size:
+            self.flush()
+
+    def line(self, *values, sep=' ', end='\n'):
+        # Same output as print(*values, sep=sep, end=end).
+        self.write(sep.join(map(str, values)) + end)
+
+    def values(self, values, sep=' ', end='\n'):
+        # print(*values, sep=sep, end=end) for any iterable, formatted in
+        # batches so a generator is never materialised at once.
+        first = True
+        for batch in _batches(values):
+            text = sep.join(map(str, batch))
+            self.write(text if first else sep + text)
+            first = False
+        self.write(end)
+
+    def each(self, values, end=' '):
+        # for v in values: print(v, end=end)
+        for batch in _batches(values):
+            self.write(end.join(map(str, batch)) + end)
+
+    def matrix(self, rows, sep=' ', end='\n'):
+        # print(*row, sep=sep, end=end) for every row
+        for row in rows:
+            self.values(row, sep, end)
+
+    def flush(self):
+        if self._parts:
+            self.stream.write(''.join(self._parts))
+            self._parts = []
+            self._size = 0
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
@@ -0,0 +1,127 @@
+# Frequency counting for inputs too large for a Counter of every value
+# (01_QDay1, 02_QDay1, 32_QDay1, 35_QDay4, 38_QDay4).
+#
+#   misra_gries(values, k)      every value seen more than n / k times is
+#                               among at most k - 1 candidates; O(k) memory
+#   CountMinSketch(w, d)        approximate counts of any value in w x d
+#                               counters, for unbounded streams
+#   values_with_count(v, c)     exact, by numpy.unique when NumPy is
+#   mode(values)                installed (no Python object per distinct
+#                               value), by a Counter otherwise
+#
+# The streaming functions take any iterable and consume it in blocks of
+# BLOCK values: each block is counted exactly by a Counter (in C) and then
+# folded into the running summary, so memory is O(BLOCK + summary) however
+# long the stream is.
+
+import random
+from array import array
+from collections import Counter
+from itertools import islice
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BLOCK = 1 << 16
+
+
+def _blocks(values, size=BLOCK):
+    # Counter of each run of `size` values
+    it = iter(values)
+    while True:
+        block = Counter(islice(it, size))
+        if not block:
+            return
+        yield block
+
+
+def misra_gries(values, k, block_size=BLOCK):
+    # (summary, n): summary maps at most k - 1 values to counts that are at
+    # most n / k below the true ones, and holds every value seen more than
+    # n / k times. For k = 2 this is Boyer-Moore majority voting.
+    #
+    # Summaries merge (Agarwal et al., "Mergeable summaries"): add the
+    # counters, subtract the k-th largest count from all of them and drop
+    # what is left at zero or below. An exact Counter of one block is a
+    # summary with no error, so blocks are merged in one at a time.
+    summary = Counter()
+    n = 0
+    for block in _blocks(values, block_size):
+        n += sum(block.values())
+        summary.update(block)
+        if len(summary) >= k:
+            cut = sorted(summary.values(), reverse=True)[k - 1]
+            summary = Counter({value: count - cut for value, count in summary.items()
+                               if count > cut})
+    return summary, n
+
+
+class CountMinSketch:
+    # Approximate counts in fixed memory: depth rows of width counters, each
+    # row with its own hash. A value's estimate is the smallest of its
+    # counters, so it never undercounts and overcounts by at most
+    # e * n / width with probability 1 - exp(-depth).
+
+    def __init__(self, width=1 << 16, depth=4, seed=None):
+        rng = random.Random(seed)
+        self.width = width
+        self.salts = [rng.getrandbits(64) for _ in range(depth)]
+        self.rows = [array('q', bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+
+    def _cells(self, value):
+        width = self.width
+        for salt, row in zip(self.salts, self.rows):
+            yield row, hash((salt, value)) % width
+
+    def add(self, value, count=1):
+        for row, i in self._cells(value):
+            row[i] += count
+        self.total += count
+
+    def update(self, values):
+        for block in _blocks(values):
+            for value, count in block.items():
+                self.add(value, count)
+
+    def __getitem__(self, value):
+        return min(row[i] for row, i in self._cells(value))
+
+    def heavy_hitters(self, candidates, fraction):
+        # The candidates whose estimate exceeds fraction * total. The sketch
+        # cannot list values itself; the keys of a misra_gries() summary
+        # with k > 1 / fraction hold every value that can qualify.
+        threshold = fraction * self.total
+        return [value for value in candidates if self[value] > threshold]
+
+
+def _is_numeric_array(values):
+    return numpy is not None and isinstance(values, (array, numpy.ndarray))
+
+
+def values_with_count(values, count):
+    # The distinct values seen exactly `count` times (sorted with NumPy,
+    # in first-seen order otherwise).
+    if _is_numeric_array(values):
+        keys, counts = numpy.unique(numpy.asarray(values), return_counts=True)
+        return keys[counts == count].tolist()
+    return [value for value, seen in Counter(values).items() if seen == count]
+
+
+def mode(values):
+    # (value, count) of the most frequent value, the first seen one on a
+    # tie; None for no values.
+    if _is_numeric_array(values):
+        if not len(values):
+            return None
+        keys, first, counts = numpy.unique(numpy.asarray(values), return_index=True,
+                                           return_counts=True)
+        best = counts == counts.max()
+        i = first[best].argmin()
+        return int(keys[best][i]), int(counts[best][i])
+    freq = Counter(values)
+    if not freq:
+        return None
+    return freq.most_common(1)[0]
@@ -0,0 +1,77 @@
+# Longest increasing subsequence (08_Python_practice/08_QP.py).
+#
+# Patience sorting: tails[k] is the smallest value that can end an
+# increasing subsequence of length k + 1. Each new value replaces the first
+# tail that is >= it (bisect_left, strictly increasing) or > it
+# (bisect_right, non-decreasing), or extends the list. tails stays sorted,
+# so every step is one binary search: O(n log n) instead of the O(n^2)
+# double loop.
+#
+# For the subsequence itself every element remembers the element that
+# ended the next shorter subsequence when it was placed; walking those
+# links back from the last tail gives one longest subsequence.
+
+from bisect import bisect_left, bisect_right
+
+
+def lis_length(values, strict=True):
+    search = bisect_left if strict else bisect_right
+    tails = []
+    for value in values:
+        k = search(tails, value)
+        if k == len(tails):
+            tails.append(value)
+        else:
+            tails[k] = value
+    return len(tails)
+
+
+def longest_increasing_subsequence(values, strict=True):
+    # One longest (strictly, or non-strictly) increasing subsequence, as a list.
+    lis = IncreasingSubsequence(strict)
+    lis.extend(values)
+    return lis.sequence()
+
+
+class IncreasingSubsequence:
+    # Streaming version: push() values one at a time; len() and sequence()
+    # describe the longest subsequence of everything pushed so far.
+
+    def __init__(self, strict=True):
+        self.strict = strict
+        self._search = bisect_left if strict else bisect_right
+        self.tails = []         # smallest tail value per length
+        self._tail_index = []   # position of that tail among the values
+        self._values = []
+        self._previous = []     # per value: position of its predecessor, or -1
+
+    def push(self, value):
+        # Returns the length of the longest subsequence ending with value.
+        tails = self.tails
+        k = self._search(tails, value)
+        position = len(self._values)
+        self._values.append(value)
+        self._previous.append(self._tail_index[k - 1] if k else -1)
+        if k == len(tails):
+            tails.append(value)
+            self._tail_index.append(position)
+        else:
+            tails[k] = value
+            self._tail_index[k] = position
+        return k + 1
+
+    def extend(self, values):
+        for value in values:
+            self.push(value)
+
+    def __len__(self):
+        return len(self.tails)
+
+    def sequence(self):
+        result = []
+        position = self._tail_index[-1] if self._tail_index else -1
+        while position != -1:
+            result.append(self._values[position])
+            position = self._previous[position]
+        result.reverse()
+        return result
@@ -0,0 +1,93 @@
+# Matrix problems (39_QDay5 - 44_QDay5).
+#
+# A matrix is either a 2-D NumPy array or, when NumPy is not installed, a
+# list of rows (array('q') or lists). read_matrix() picks the right one
+# while parsing stdin, and every function below accepts both: NumPy arrays
+# go through vectorized calls (sum, min, trace) and views (.T, row[::-1]),
+# so nothing is copied or looped over in Python; lists of rows take the
+# plain Python path. Sums of int64 arrays are computed in int64 when no
+# sum can leave that range (every |value| * count below 2**63), and over
+# Python ints otherwise, so they never wrap around.
+
+from .fastio import InputReader
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def is_ndarray(matrix):
+    return numpy is not None and isinstance(matrix, numpy.ndarray)
+
+
+def read_matrix(reader=None):
+    # "rows cols" on the first line, then the values.
+    if reader is None:
+        reader = InputReader()
+    rows, cols = reader.ints_line()[:2]
+    return reader.matrix(rows, cols, as_numpy=numpy is not None)
+
+
+# 39_QDay5
+def row_major(matrix):
+    if is_ndarray(matrix):
+        return matrix.ravel()
+    return (value for row in matrix for value in row)
+
+
+# 40_QDay5: the columns, as rows (a transposed view for NumPy)
+def columns(matrix):
+    if is_ndarray(matrix):
+        return matrix.T
+    return [list(column) for column in zip(*matrix)]
+
+
+def _exact_sum(values):
+    # Sum of a 1-D or 2-D ndarray as a Python int: in int64 when the bound
+    # says it cannot overflow, else element by element as Python ints.
+    if values.dtype != object and values.size:
+        bound = max(abs(int(values.max())), abs(int(values.min())))
+        if bound * values.size >= 1 << 63:
+            values = values.astype(object)
+    return int(values.sum())
+
+
+# 41_QDay5
+def total(matrix):
+    if is_ndarray(matrix):
+        return _exact_sum(matrix)
+    return sum(sum(row) for row in matrix)
+
+
+# 42_QDay5: (primary, secondary) diagonal sums of a square matrix
+def diagonal_sums(matrix):
+    if is_ndarray(matrix):
+        return _exact_sum(matrix.diagonal()), _exact_sum(numpy.fliplr(matrix).diagonal())
+    n = len(matrix)
+    primary = sum(matrix[i][i] for i in range(n))
+    secondary = sum(matrix[i][n - i - 1] for i in range(n))
+    return primary, secondary
+
+
+# 43_QDay5: rows left to right, then right to left, alternately
+def snake_rows(matrix):
+    # The rows in snake direction, as views where the type allows it.
+    for i, row in enumerate(matrix):
+        yield row if i % 2 == 0 else row[::-1]
+
+
+def snake_order(matrix):
+    if is_ndarray(matrix):
+        return numpy.concatenate(list(snake_rows(matrix))) if len(matrix) else matrix.ravel()
+    result = []
+    for row in snake_rows(matrix):
+        result.extend(row)
+    return result
+
+
+# 44_QDay5
+def minimum(matrix):
+    if is_ndarray(matrix):
+        return int(matrix.min())
+    return min(min(row) for row in matrix)
@@ -0,0 +1,128 @@
+# Out-of-core versions of the matrix problems (39_QDay5 - 44_QDay5).
+#
+#   python -m solvers.matrix_stream sum < huge_matrix.txt
+#
+# Same input and output format as the scripts, but the matrix is never held
+# in memory: rows are parsed one line at a time (fastio.iter_int_rows), so
+# memory is O(cols) for everything except the transpose.
+#
+#   * matrix_stats() gets sum, minimum and both diagonal sums in one pass;
+#   * snake_rows() reverses every other row as it streams past;
+#   * transposed() spills the rows as int64 to a scratch file, maps it with
+#     mmap and reads it back a block of columns at a time, so memory is
+#     bounded by block_bytes (64 MB by default) instead of rows x cols.
+#
+# Operations: rows (39), columns (40), sum (41), diagonals (42),
+# snake (43), min (44).
+
+import argparse
+import mmap
+import sys
+import tempfile
+from array import array
+
+from .fastio import OutputWriter, iter_int_rows, parse_ints
+
+BLOCK_BYTES = 64 << 20
+
+
+def stream_matrix(stream=None):
+    # (rows, cols, row iterator) for "rows cols" followed by the values
+    if stream is None:
+        stream = sys.stdin.buffer
+    rows, cols = parse_ints(stream.readline())[:2]
+    return rows, cols, iter_int_rows(stream)
+
+
+def matrix_stats(rows, n=None):
+    # (total, minimum, primary, secondary) in one pass over the rows; n is
+    # the side of the square matrix (defaults to the row length).
+    total = 0
+    smallest = None
+    primary = secondary = 0
+    for i, row in enumerate(rows):
+        total += sum(row)
+        low = min(row)
+        if smallest is None or low < smallest:
+            smallest = low
+        if i < len(row):
+            primary += row[i]
+        j = (len(row) if n is None else n) - 1 - i
+        if 0 <= j < len(row):
+            secondary += row[j]
+    return total, smallest, primary, secondary
+
+
+def snake_rows(rows):
+    for i, row in enumerate(rows):
+        yield row if i % 2 == 0 else row[::-1]
+
+
+def transposed(rows, cols, scratch_dir=None, block_bytes=BLOCK_BYTES):
+    # Yield the columns of the matrix (as lists), first to last.
+    with tempfile.TemporaryFile(dir=scratch_dir) as scratch:
+        n = 0
+        for row in rows:
+            if len(row) != cols:
+                raise ValueError(f"row {n} has {len(row)} values, expected {cols}")
+            if not isinstance(row, array):
+                row = array('q', row)
+            scratch.write(row.tobytes())
+            n += 1
+        scratch.flush()
+        if n == 0 or cols == 0:
+            return
+        with mmap.mmap(scratch.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            width = max(1, min(cols, block_bytes // (8 * n)))
+            for first in range(0, cols, width):
+                last = min(cols, first + width)
+                # The block of columns first..last, row by row, then read
+                # out column by column with a strided view.
+                block = array('q')
+                for i in range(n):
+                    start = (i * cols + first) * 8
+                    block.frombytes(mapped[start:start + (last - first) * 8])
+                view = memoryview(block)
+                for k in range(last - first):
+                    yield view[k::last - first].tolist()
+                view.release()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Matrix problems on input larger than memory.")
+    parser.add_argument('operation', choices=('rows', 'columns', 'sum', 'diagonals', 'snake', 'min'))
+    parser.add_argument('--scratch-dir', help="where the transpose keeps its scratch file")
+    parser.add_argument('--block-mb', type=int, default=BLOCK_BYTES >> 20,
+                        help="memory for one block of columns when transposing")
+    options = parser.parse_args(argv)
+
+    n, m, rows = stream_matrix()
+    with OutputWriter() as out:
+        if options.operation in ('rows', 'columns'):
+            if options.operation == 'columns':
+                rows = transposed(rows, m, options.scratch_dir, options.block_mb << 20)
+            for row in rows:
+                out.each(row, end=' ')
+                out.write('\n')
+        elif options.operation == 'snake':
+            first = True
+            for row in snake_rows(rows):
+                if len(row):
+                    if not first:
+                        out.write(' ')
+                    out.values(row, end='')
+                    first = False
+            out.write('\n')
+        else:
+            total, smallest, primary, secondary = matrix_stats(rows, n)
+            if options.operation == 'sum':
+                out.line(total)
+            elif options.operation == 'diagonals':
+                out.line(primary)
+                out.line(secondary)
+            else:
+                out.line(smallest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Arithmetic and number theory problems.
+
+import math
+from collections import Counter
+
+
+# 03_QDay1: the number missing from 1..n
+def missing_number(n, values):
+    return n * (n + 1) // 2 - sum(values)
+
+
+# 04_QDay1: "ThreeFive" / "Three" / "Five" or the number itself
+def fizz_buzz(values):
+    words = []
+    for num in values:
+        if num % 15 == 0:
+            words.append("ThreeFive")
+        elif num % 3 == 0:
+            words.append("Three")
+        elif num % 5 == 0:
+            words.append("Five")
+        else:
+            words.append(num)
+    return words
+
+
+# 07_QDay1: numbers equal to the sum of their digits ** digit count
+def is_armstrong(num):
+    digits = str(num)
+    power = len(digits)
+    return num == sum(int(d) ** power for d in digits)
+
+
+def armstrong_numbers(values):
+    return [num for num in values if is_armstrong(num)]
+
+
+# 08_QDay2: minutes the new watch lags behind (negative if it is early)
+def watch_difference(h, m, h1, m1, x):
+    correct_time = (h + x) * 60 + m
+    return correct_time - (h1 * 60 + m1)
+
+
+# 09_QDay2: |product of digits - sum of digits|
+def product_sum_difference(n):
+    digits = [int(d) for d in str(abs(n))]
+    return abs(math.prod(digits) - sum(digits))
+
+
+# 10_QDay2: primes in [n, m] whose digit sum is prime as well. The range
+# query is sieved (sieve.digit_sum_primes); is_prime() is plain trial
+# division, fine for a single number.
+def is_prime(n):
+    if n < 2:
+        return False
+    for i in range(2, math.isqrt(n) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+# 11_QDay3: right/down paths through an m x n grid
+def unique_paths(m, n):
+    return math.comb(m + n - 2, m - 1)
+
+
+# 12_QDay3: sum of cubes of L..R
+def cube_sum(low, high):
+    return sum(i ** 3 for i in range(low, high + 1))
+
+
+# 13_QDay3: (total, average, highest, lowest)
+def sales_summary(sales):
+    sales = list(sales)
+    total = sum(sales)
+    return total, total / len(sales), max(sales), min(sales)
+
+
+# 14_QDay3: [(i, n * i) for i in 1..10] and the sum of the products
+def multiplication_table(n):
+    rows = [(i, n * i) for i in range(1, 11)]
+    return rows, sum(product for _, product in rows)
+
+
+# 33_QDay4: number of distinct permutations of the characters of text
+def distinct_permutation_count(text):
+    denominator = 1
+    for count in Counter(text).values():
+        denominator *= math.factorial(count)
+    return math.factorial(len(text)) // denominator
+
+
+# 36_QDay4: population standard deviation
+def std_dev(values):
+    values = list(values)
+    mean = sum(values) / len(values)
+    return (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5
+
+
+# 37_QDay4
+def lcm(a, b):
+    return a * b // math.gcd(a, b)
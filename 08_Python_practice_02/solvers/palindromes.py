@@ -0,0 +1,134 @@
+# Palindromic substrings via Manacher's algorithm (23_QDay3 and
+# 08_Python_practice/09_QP.py).
+#
+#   pal = Palindromes("abaab")
+#   pal.count()                 # 8
+#   pal.is_palindrome(1, 4)     # "baa" -> False
+#   list(pal.substrings())      # by start, then end, like 23_QDay3 prints
+#
+# The text is seen with a separator between characters and around it
+# ("#a#b#a#a#b#"), so odd and even palindromes both have a center. radii[k]
+# is the radius of the longest palindrome around position k of that string,
+# which is also the length of the palindrome in the original text. Manacher
+# fills the table in O(n) by mirroring radii inside the rightmost
+# palindrome found so far.
+#
+# text[start:stop] has its center at k = start + stop, so it is a
+# palindrome exactly when radii[start + stop] >= stop - start: every
+# substring query is O(1) once the table is built.
+
+from bisect import bisect_right
+
+_LEFT, _RIGHT = object(), object()     # sentinels, equal to nothing else
+
+
+def manacher(text):
+    # radii for the 2 * len(text) + 1 centers
+    n = len(text)
+    size = 2 * n + 1
+    # t[k + 1] is position k of the separated text, padded with sentinels
+    t = [None] * (size + 2)
+    t[0], t[-1] = _LEFT, _RIGHT
+    t[2:-1:2] = text
+    radii = [0] * size
+    mirror = right = 0       # twice the center of the rightmost palindrome
+    for k in range(1, size):
+        if k < right:
+            r = radii[mirror - k]
+            if r < right - k:
+                # The mirror lies inside the rightmost palindrome: no
+                # expansion can succeed.
+                radii[k] = r
+                continue
+            r = right - k
+        else:
+            r = 0
+        while t[k - r] == t[k + r + 2]:
+            r += 1
+        radii[k] = r
+        mirror, right = 2 * k, k + r
+    return radii
+
+
+class Palindromes:
+    def __init__(self, text):
+        self.text = text
+        self.radii = manacher(text)
+
+    def is_palindrome(self, start, stop):
+        # text[start:stop] (non-empty) reads the same both ways
+        return self.radii[start + stop] >= stop - start
+
+    def count(self):
+        # A center of radius r holds (r + 1) // 2 palindromes; the radius is
+        # odd exactly at the n character centers.
+        return (sum(self.radii) + len(self.text)) // 2
+
+    def longest(self):
+        # (start, stop) of the first longest palindrome, (0, 0) for ''
+        radii = self.radii
+        if not self.text:
+            return 0, 0
+        length = max(radii)
+        k = radii.index(length)
+        start = (k - length) // 2
+        return start, start + length
+
+    def longest_palindrome(self):
+        start, stop = self.longest()
+        return self.text[start:stop]
+
+    def spans(self):
+        # (start, stop) of every palindromic substring, by start then stop,
+        # in time proportional to the number of palindromes. The
+        # palindromes starting at i are one per center k > 2i whose
+        # longest palindrome reaches back to i, with stop = k - i; so the
+        # active centers are kept sorted and new ones merged in at the
+        # start where they first reach.
+        radii = self.radii
+        n = len(self.text)
+        reaches = [[] for _ in range(n)]
+        for k, r in enumerate(radii):
+            if r:
+                reaches[(k - r) // 2].append(k)
+        active = []
+        for i in range(n):
+            limit = 2 * i
+            active = [k for k in active if k > limit]
+            if reaches[i]:
+                active += reaches[i]
+                active.sort()
+            for k in active:
+                yield i, k - i
+
+    def substrings(self):
+        text = self.text
+        for start, stop in self.spans():
+            yield text[start:stop]
+
+    def three_palindromes(self):
+        # First split into three non-empty palindromes, scanning the end of
+        # the first part, then the end of the second, from the left;
+        # None if there is none.
+        radii = self.radii
+        n = len(self.text)
+        firsts = [i for i in range(1, n - 1) if radii[i] >= i]
+        lasts = [j for j in range(2, n) if radii[j + n] >= n - j]
+        for i in firsts:
+            for j in lasts[bisect_right(lasts, i):]:
+                if radii[i + j] >= j - i:
+                    text = self.text
+                    return text[:i], text[i:j], text[j:]
+        return None
+
+
+def count_palindromes(text):
+    return Palindromes(text).count()
+
+
+def longest_palindrome(text):
+    return Palindromes(text).longest_palindrome()
+
+
+def three_palindromes(text):
+    return Palindromes(text).three_palindromes()
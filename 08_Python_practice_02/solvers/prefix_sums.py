@@ -0,0 +1,124 @@
+# Subarrays with a given sum, by prefix sums (29_QDay4, 30_QDay4).
+#
+#   index = PrefixIndex(values)      # prefix sums, computed once
+#   index.count(5)                   # how many subarrays sum to 5
+#   for start, end in index.pairs(5): ...      # lazily, ordered by end
+#   index.longest(5), index.shortest(0)        # (start, end) or None
+#   index.exists(0)
+#   has_target_sum(values, 0)        # streaming, stops at the first match
+#
+# values[start:end + 1] sums to target exactly when
+# prefix[end + 1] - prefix[start] == target, with prefix[0] = 0. Every
+# query is one pass over the prefix sums that looks up prefix - target
+# among the prefixes already seen, so any number of targets can be asked
+# of the same index. The index itself holds all n + 1 prefix sums; on top
+# of that each query needs:
+#
+#   count, shortest, exists   O(distinct prefixes): a count / last position
+#   longest                   nothing more after the first-position table,
+#                             built once and shared by all targets
+#   pairs                     O(n) positions, but the pairs themselves are
+#                             yielded one at a time, never collected
+#
+# count_target_sums() and has_target_sum() take a plain iterable and never
+# store the prefix sums, so they are O(distinct prefixes) overall.
+
+from array import array
+from collections import Counter
+from itertools import accumulate
+
+
+class PrefixIndex:
+    def __init__(self, values):
+        try:
+            self.prefix = array('q', accumulate(values, initial=0))
+        except OverflowError:      # sums beyond 64 bits
+            self.prefix = list(accumulate(values, initial=0))
+        self._first = None
+
+    def __len__(self):
+        # number of values indexed
+        return len(self.prefix) - 1
+
+    def count(self, target):
+        seen = Counter()
+        total = 0
+        for p in self.prefix:
+            total += seen[p - target]
+            seen[p] += 1
+        return total
+
+    def pairs(self, target):
+        # (start, end) of every matching subarray, by end, then by start
+        positions = {}
+        for i, p in enumerate(self.prefix):
+            starts = positions.get(p - target)
+            if starts:
+                for start in starts:
+                    yield start, i - 1
+            if p in positions:
+                positions[p].append(i)
+            else:
+                positions[p] = [i]
+
+    def first_positions(self):
+        # prefix value -> first index where it occurs
+        if self._first is None:
+            first = {}
+            for i, p in enumerate(self.prefix):
+                first.setdefault(p, i)
+            self._first = first
+        return self._first
+
+    def longest(self, target):
+        # The longest matching subarray, the earliest one on a tie
+        first = self.first_positions()
+        best = None
+        length = 0
+        for i, p in enumerate(self.prefix):
+            start = first.get(p - target)
+            if start is not None and i - start > length:
+                best, length = (start, i - 1), i - start
+        return best
+
+    def shortest(self, target):
+        # The shortest matching subarray, the earliest one on a tie
+        last = {}
+        best = None
+        length = len(self.prefix)
+        for i, p in enumerate(self.prefix):
+            start = last.get(p - target)
+            if start is not None and i - start < length:
+                best, length = (start, i - 1), i - start
+                if length == 1:
+                    break
+            last[p] = i
+        return best
+
+    def exists(self, target):
+        return _any_match(self.prefix, target)
+
+
+def _any_match(prefixes, target):
+    # prefixes start with the empty prefix 0; stops at the first match
+    seen = set()
+    for p in prefixes:
+        if p - target in seen:
+            return True
+        seen.add(p)
+    return False
+
+
+def has_target_sum(values, target):
+    # exists() without keeping the prefix sums
+    return _any_match(accumulate(values, initial=0), target)
+
+
+def count_target_sums(values, target):
+    # count() without keeping the prefix sums: one pass over any iterable
+    seen = Counter([0])
+    total = 0
+    for p in accumulate(values):
+        total += seen[p - target]
+        seen[p] += 1
+    return total
@@ -0,0 +1,25 @@
+# Problems over student records.
+
+from .topk import top_k
+
+
+# 05_QDay1: the k best (marks, name) pairs, highest marks first. Ties keep
+# the script's original order: by name, descending. students can be any
+# iterable; only k of them are held at a time.
+def top_k_students(students, k):
+    return top_k(students, k)
+
+
+# 31_QDay4_IMP: names of students older than 20 and the average grade of
+# the female students (None if there are none).
+# records are (name, age, gender, grade) tuples.
+def data_query(records):
+    names = []
+    female_grades = []
+    for name, age, gender, grade in records:
+        if age > 20:
+            names.append(name)
+        if gender.lower() == "female":
+            female_grades.append(grade)
+    average = sum(female_grades) / len(female_grades) if female_grades else None
+    return names, average
@@ -0,0 +1,161 @@
+# Segmented Sieve of Eratosthenes for prime range queries.
+#
+#   from solvers.sieve import primes_in_range, count_primes, digit_sum_primes
+#   for p in primes_in_range(10 ** 9, 10 ** 9 + 1000): ...
+#
+# [n, m] is sieved one segment at a time. A segment is a bytearray with one
+# byte per odd number (1 = prime), so a 1 MB segment covers 2M numbers.
+# Every base prime p <= sqrt(m) strikes its multiples with one slice
+# assignment, and the primes are read back with itertools.compress, so all
+# the per-number work happens in C. Memory is O(segment + sqrt(m)) however
+# wide the range is.
+#
+# workers > 1 sieves segments in a multiprocessing pool; results still come
+# out in order.
+
+import math
+from itertools import compress
+
+SEGMENT_SIZE = 1 << 20     # bytes (odd numbers) per segment
+
+
+def simple_sieve(limit):
+    # All primes <= limit.
+    if limit < 2:
+        return []
+    flags = bytearray([1]) * (limit + 1)
+    flags[0] = flags[1] = 0
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return list(compress(range(limit + 1), flags))
+
+
+def sieve_segment(low, size, base_primes):
+    # Flags for the odd numbers low, low + 2, ..., low + 2 * (size - 1);
+    # low must be odd. base_primes are the odd primes up to sqrt(high).
+    flags = bytearray([1]) * size
+    zeros = memoryview(bytes(size))
+    high = low + 2 * size
+    for p in base_primes:
+        square = p * p
+        if square >= high:
+            break
+        start = max(square, (low + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        index = (start - low) // 2
+        if index < size:
+            flags[index::p] = zeros[:(size - 1 - index) // p + 1]
+    if low == 1:
+        flags[0] = 0
+    return flags
+
+
+def _segments(n, m, segment_size):
+    # (low, size) for the odd numbers in [n, m]
+    low = n | 1
+    while low <= m:
+        size = min(segment_size, (m - low) // 2 + 1)
+        yield low, size
+        low += 2 * size
+
+
+_worker_primes = None
+
+
+def _init_worker(base_primes):
+    global _worker_primes
+    _worker_primes = base_primes
+
+
+def _sieve_task(task):
+    low, size = task
+    return sieve_segment(low, size, _worker_primes)
+
+
+def sieved_segments(n, m, segment_size=SEGMENT_SIZE, workers=1):
+    # Yield (low, flags) for consecutive segments covering the odd numbers
+    # of [n, m].
+    n = max(n, 1)
+    if m < n:
+        return
+    base_primes = simple_sieve(math.isqrt(m))[1:]      # odd ones only
+    segment_size = max(segment_size, math.isqrt(m) // 2)
+    tasks = _segments(n, m, segment_size)
+    if workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(workers, _init_worker, (base_primes,)) as pool:
+            tasks = list(tasks)
+            for (low, _), flags in zip(tasks, pool.imap(_sieve_task, tasks)):
+                yield low, flags
+    else:
+        for low, size in tasks:
+            yield low, sieve_segment(low, size, base_primes)
+
+
+def primes_in_range(n, m, segment_size=SEGMENT_SIZE, workers=1):
+    # Generator over the primes in [n, m], ascending.
+    if n <= 2 <= m:
+        yield 2
+    for low, flags in sieved_segments(n, m, segment_size, workers):
+        yield from compress(range(low, low + 2 * len(flags), 2), flags)
+
+
+def count_primes(n, m, segment_size=SEGMENT_SIZE, workers=1):
+    count = 1 if n <= 2 <= m else 0
+    for _, flags in sieved_segments(n, m, segment_size, workers):
+        count += flags.count(1)
+    return count
+
+
+# Digit sums of 0..9999, summed four digits at a time.
+DIGIT_SUMS = bytes(sum(map(int, str(i))) for i in range(10000))
+
+
+def prime_table(limit):
+    # bytearray t with t[k] == 1 exactly when k <= limit is prime
+    table = bytearray(limit + 1)
+    for p in simple_sieve(limit):
+        table[p] = 1
+    return table
+
+
+# Digit sums stay tiny (at most 9 per digit), so primality of a digit sum
+# is a lookup in this table; it grows if a longer number ever shows up.
+_digit_sum_prime = prime_table(199)
+
+
+def _digit_sum_table(number):
+    global _digit_sum_prime
+    largest = 9 * len(str(abs(number)))
+    if largest >= len(_digit_sum_prime):
+        _digit_sum_prime = prime_table(2 * largest)
+    return _digit_sum_prime
+
+
+def digit_sum(n):
+    n = abs(n)
+    total = 0
+    while n:
+        n, rest = divmod(n, 10000)
+        total += DIGIT_SUMS[rest]
+    return total
+
+
+def is_digit_sum_prime(n):
+    return _digit_sum_table(n)[digit_sum(n)] == 1
+
+
+def digit_sum_primes(n, m, segment_size=SEGMENT_SIZE, workers=1):
+    # Primes in [n, m] whose digit sum is prime as well.
+    table = _digit_sum_table(m)
+    sums = DIGIT_SUMS
+    for p in primes_in_range(n, m, segment_size, workers):
+        q, r = divmod(p, 10000)
+        s = sums[r]
+        while q:
+            q, r = divmod(q, 10000)
+            s += sums[r]
+        if table[s]:
+            yield p
@@ -0,0 +1,88 @@
+# String and word problems.
+
+from itertools import groupby, permutations
+
+from .palindromes import Palindromes
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+
+# 16_QDay3
+def swap_case(text):
+    return text.swapcase()
+
+
+# 17_QDay3: shift letters and digits k places, wrapping within their group
+def shift_chars(text, k):
+    result = []
+    for ch in text:
+        if 'A' <= ch <= 'Z':
+            ch = chr((ord(ch) - ord('A') + k) % 26 + ord('A'))
+        elif 'a' <= ch <= 'z':
+            ch = chr((ord(ch) - ord('a') + k) % 26 + ord('a'))
+        elif '0' <= ch <= '9':
+            ch = chr((ord(ch) - ord('0') + k) % 10 + ord('0'))
+        result.append(ch)
+    return ''.join(result)
+
+
+# 18_QDay3: (ascending, descending)
+def sort_words(words):
+    words = list(words)
+    return sorted(words), sorted(words, reverse=True)
+
+
+# 19_QDay3: integer average of the character codes
+def ascii_average(text):
+    return sum(map(ord, text)) // len(text)
+
+
+# 20_QDay3: letters a-z not in text (any case), in order
+def missing_letters(text):
+    present = set(text.lower())
+    return ''.join(ch for ch in ALPHABET if ch not in present)
+
+
+# 21_QDay3
+def is_palindrome(text):
+    return text == text[::-1]
+
+
+# 22_QDay3: case-insensitive
+def is_anagram(first, second):
+    return sorted(first.lower()) == sorted(second.lower())
+
+
+# 23_QDay3: every palindromic substring, by start then end position
+def palindromic_substrings(text):
+    return Palindromes(text).substrings()
+
+
+# 24_QDay3: "aaabbc" -> "a3b2c1"
+def run_length(text):
+    return ''.join(f"{ch}{sum(1 for _ in group)}" for ch, group in groupby(text))
+
+
+# 25_QDay3: the first of the longest words
+def longest_word(words):
+    return max(words, key=len, default='')
+
+
+# 26_QDay3: the first of the longest palindromic words, '' if there is none
+def longest_palindromic_word(words):
+    return max((w for w in words if is_palindrome(w)), key=len, default='')
+
+
+# 27_QDay3
+def reverse_words(text):
+    return ' '.join(reversed(text.split()))
+
+
+# 33_QDay4_next: distinct permutations of text, sorted
+def unique_permutations(text):
+    return sorted(set(''.join(p) for p in permutations(text)))
+
+
+# 34_QDay4: distinct words (case-sensitive) as (ascending, descending)
+def unique_words_sorted(words):
+    return sort_words(set(words))
@@ -0,0 +1,92 @@
+# Problems over contiguous subarrays.
+
+import math
+import operator
+
+from .prefix_sums import PrefixIndex, has_target_sum
+
+
+# 15_QDay3_Extra: every subarray, by start then end position
+def subarrays(values):
+    values = list(values)
+    n = len(values)
+    for i in range(n):
+        for j in range(i, n):
+            yield values[i:j + 1]
+
+
+def subarray_texts(values):
+    # str() of every subarray, in the order of subarrays(), without slicing
+    # the list: each text extends the previous one by one element.
+    reprs = [repr(value) for value in values]
+    n = len(reprs)
+    for i in range(n):
+        text = '[' + reprs[i]
+        yield text + ']'
+        for j in range(i + 1, n):
+            text += ', ' + reprs[j]
+            yield text + ']'
+
+
+# 15_QDay3: the distinct values of OR over all subarrays.
+#
+# For OR, AND and GCD the value of values[i:j + 1] only changes a few times
+# as i moves left: each change adds a bit (OR), drops a bit (AND) or at
+# least halves the value (GCD). So the distinct values over the subarrays
+# ending at j form a short chain, at most about log2(max) + 1 long, and the
+# chain for j + 1 is op(v, x) for each v in it, plus x = values[j + 1].
+# Along the chain each value absorbs the next one (v | w == w for OR), so
+# once op(v, x) == v the rest of the chain is unchanged as well and is
+# copied over without calling op. That makes the whole scan O(n log max)
+# in the worst case and close to O(n) for typical input.
+
+def distinct_subarray_values(values, op):
+    # Distinct op(values[i:j + 1]) over all i <= j. chain holds the distinct
+    # values ending at the current index, nearest start first; only the
+    # values computed here can be new, the copied tail was counted before,
+    # so they go into the set in one update() (none at all when x repeats
+    # the previous value and the chain is unchanged).
+    result = set()
+    update = result.update
+    chain = []
+    for x in values:
+        new = [x]
+        last = x
+        k = 0
+        for v in chain:
+            w = op(v, x)
+            if w == v:
+                if k or v != x:
+                    update(new)
+                new += chain[k + 1:] if v == last else chain[k:]
+                break
+            if w != last:
+                new.append(w)
+                last = w
+            k += 1
+        else:
+            update(new)
+        chain = new
+    return result
+
+
+def subarray_ors(values):
+    return distinct_subarray_values(values, operator.or_)
+
+
+def subarray_ands(values):
+    return distinct_subarray_values(values, operator.and_)
+
+
+def subarray_gcds(values):
+    return distinct_subarray_values(values, math.gcd)
+
+
+# 29_QDay4: (start, end) of every subarray summing to target, ordered by end
+def target_sum_subarrays(values, target):
+    return list(PrefixIndex(values).pairs(target))
+
+
+# 30_QDay4
+def has_zero_sum_subarray(values):
+    return has_target_sum(values, 0)
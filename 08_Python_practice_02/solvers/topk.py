@@ -0,0 +1,47 @@
+# Bounded top-k selection (05_QDay1).
+#
+#   best = top_k(records, 10)                      # 10 largest, best first
+#   best = top_k(records, 10, key=lambda r: (r[0], Reversed(r[1])))
+#   best = merge_top_k([best_a, best_b], 10)       # combine partial results
+#
+# top_k() keeps a heap of the k best records seen so far (heapq.nlargest /
+# nsmallest), so it is O(n log k) time and O(k) memory and takes any
+# iterable, including a generator reading a file that does not fit in
+# memory. The result is the same as sorted(records, key=key,
+# reverse=largest)[:k], ties included.
+#
+# Partial results from several files or worker processes are already
+# sorted best first, so merge_top_k() only has to merge their heads.
+
+import heapq
+from functools import total_ordering
+from itertools import islice
+
+
+def top_k(records, k, key=None, largest=True):
+    if largest:
+        return heapq.nlargest(k, records, key=key)
+    return heapq.nsmallest(k, records, key=key)
+
+
+def merge_top_k(partials, k, key=None, largest=True):
+    # The k best of several top_k() results (with the same key / largest).
+    # On ties, records from earlier partials come first.
+    return list(islice(heapq.merge(*partials, key=key, reverse=largest), k))
+
+
+@total_ordering
+class Reversed:
+    # Key wrapper that sorts the other way round, for mixing directions in
+    # one key: (marks, Reversed(name)) ranks by marks, then by name
+    # ascending.
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
@@ -0,0 +1,48 @@
+import io
+from array import array
+
+import pytest
+
+from solvers import fastio
+from solvers.fastio import InputReader, iter_ints, parse_ints
+
+BIG = b'99999999999999999999 5 -99999999999999999999'
+EDGES = b'9223372036854775807 -9223372036854775808 0'
+
+
+@pytest.fixture
+def no_numpy(monkeypatch):
+    monkeypatch.setattr(fastio, 'numpy', None)
+
+
+def test_parse_ints_fits_in_int64(no_numpy):
+    values = parse_ints(EDGES)
+    assert isinstance(values, array)
+    assert list(values) == [2 ** 63 - 1, -2 ** 63, 0]
+
+
+def test_parse_ints_overflow_falls_back_to_python_ints(no_numpy):
+    assert parse_ints(BIG) == [10 ** 20 - 1, 5, -(10 ** 20 - 1)]
+    assert parse_ints(BIG.decode()) == [10 ** 20 - 1, 5, -(10 ** 20 - 1)]
+
+
+def test_parse_ints_numpy_fits_in_int64():
+    pytest.importorskip('numpy')
+    assert list(parse_ints(EDGES)) == [2 ** 63 - 1, -2 ** 63, 0]
+    assert parse_ints(EDGES, as_numpy=True).tolist() == [2 ** 63 - 1, -2 ** 63, 0]
+
+
+def test_parse_ints_numpy_overflow_falls_back_to_python_ints():
+    pytest.importorskip('numpy')
+    assert parse_ints(BIG) == [10 ** 20 - 1, 5, -(10 ** 20 - 1)]
+    assert parse_ints(BIG, as_numpy=True).tolist() == [10 ** 20 - 1, 5, -(10 ** 20 - 1)]
+    # 19 digits, still in range: stays an int64 array
+    assert list(parse_ints(b'1000000000000000000 2')) == [10 ** 18, 2]
+
+
+def test_reader_and_stream_keep_big_values():
+    reader = InputReader(io.BytesIO(b'2\n' + BIG + b'\n'))
+    assert reader.read_int() == 2
+    assert list(reader.ints_line()) == [10 ** 20 - 1, 5, -(10 ** 20 - 1)]
+    blocks = iter_ints(io.BytesIO(BIG + b' 7'), chunk_size=8)
+    assert [v for block in blocks for v in block] == [10 ** 20 - 1, 5, -(10 ** 20 - 1), 7]
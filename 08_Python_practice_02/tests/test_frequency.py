@@ -0,0 +1,49 @@
+import math
+import random
+from collections import Counter
+
+from solvers.frequency import CountMinSketch, misra_gries
+
+
+def zipf_stream(rng, n, distinct):
+    weights = [1 / (rank + 1) for rank in range(distinct)]
+    return rng.choices(range(distinct), weights, k=n)
+
+
+def test_count_min_sketch_bounds_exact_counts():
+    rng = random.Random(7)
+    values = zipf_stream(rng, 50_000, 5_000)
+    exact = Counter(values)
+    sketch = CountMinSketch(width=1 << 12, depth=4, seed=1)
+    sketch.update(values)
+    assert sketch.total == len(values)
+    slack = math.e * len(values) / sketch.width
+    over = 0
+    for value in range(5_000):
+        estimate = sketch[value]
+        assert estimate >= exact[value]
+        over += estimate - exact[value] > slack
+    # the bound may fail per value with probability exp(-depth) < 2%
+    assert over <= 0.02 * 5_000
+
+
+def test_count_min_sketch_add_matches_update():
+    added = CountMinSketch(width=64, depth=3, seed=2)
+    updated = CountMinSketch(width=64, depth=3, seed=2)
+    values = [1, 2, 2, 3, 3, 3]
+    for value in values:
+        added.add(value)
+    updated.update(values)
+    assert added.rows == updated.rows
+    assert [added[v] for v in (1, 2, 3)] == [1, 2, 3]
+
+
+def test_heavy_hitters_with_misra_gries_candidates():
+    rng = random.Random(3)
+    values = zipf_stream(rng, 50_000, 5_000)
+    exact = Counter(values)
+    summary, n = misra_gries(values, 50)
+    sketch = CountMinSketch(seed=4)
+    sketch.update(values)
+    found = set(sketch.heavy_hitters(summary, 0.02))
+    assert {v for v, c in exact.items() if c > 0.02 * n} <= found
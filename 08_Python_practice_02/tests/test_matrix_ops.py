@@ -0,0 +1,30 @@
+import pytest
+
+from solvers.matrix_ops import diagonal_sums, total
+
+BIG = 2 ** 62
+
+
+def test_python_rows():
+    matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert total(matrix) == 45
+    assert diagonal_sums(matrix) == (15, 15)
+
+
+def test_python_rows_beyond_int64():
+    matrix = [[BIG, BIG], [BIG, -BIG]]
+    assert total(matrix) == 2 * BIG
+    assert diagonal_sums(matrix) == (0, 2 * BIG)
+
+
+def test_numpy_sums_do_not_wrap():
+    numpy = pytest.importorskip('numpy')
+    matrix = numpy.array([[BIG, BIG], [BIG, BIG]], dtype=numpy.int64)
+    assert total(matrix) == 4 * BIG
+    assert diagonal_sums(matrix) == (2 * BIG, 2 * BIG)
+    small = numpy.arange(9, dtype=numpy.int64).reshape(3, 3)
+    assert total(small) == 36
+    assert diagonal_sums(small) == (12, 12)
+    empty = numpy.zeros((0, 0), dtype=numpy.int64)
+    assert total(empty) == 0
+    assert diagonal_sums(empty) == (0, 0)
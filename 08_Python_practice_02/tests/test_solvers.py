@@ -0,0 +1,188 @@
+# solvers against brute-force references on small random inputs.
+
+import io
+import math
+import operator
+import random
+from collections import Counter
+from functools import reduce
+from itertools import combinations
+
+import pytest
+
+from solvers import (diagonal_sums, digit_sum, digit_sum_primes, has_zero_sum_subarray,
+                     is_prime, majority_elements, most_frequent_difference,
+                     palindromic_substrings, read_matrix, subarray_ands, subarray_gcds,
+                     subarray_ors, sum_of_unique, target_sum_subarrays, total, vote_winner)
+from solvers.fastio import InputReader, parse_ints
+from solvers.lis import lis_length, longest_increasing_subsequence
+from solvers.palindromes import Palindromes, three_palindromes
+from solvers.prefix_sums import PrefixIndex
+from solvers.sieve import primes_in_range
+from solvers.topk import Reversed, merge_top_k, top_k
+
+INT64_MAX = (1 << 63) - 1
+
+
+def random_lists(seed, count=200, low=-5, high=5, longest=12):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [rng.randint(low, high) for _ in range(rng.randint(0, longest))]
+
+
+def all_subarrays(values):
+    return [values[i:j] for i in range(len(values)) for j in range(i + 1, len(values) + 1)]
+
+
+# ---------- counting ----------
+
+def test_majority_elements():
+    for values in random_lists(1, low=0, high=3):
+        for k in (2, 3, 4):
+            expected = [v for v in dict.fromkeys(values) if values.count(v) > len(values) // k]
+            assert majority_elements(values, k) == expected
+
+
+def test_sum_of_unique():
+    for values in random_lists(2):
+        assert sum_of_unique(values) == sum(v for v in values if values.count(v) == 1)
+
+
+def test_sum_of_unique_beyond_int64():
+    values = parse_ints(b'9223372036854775807 9223372036854775807 1 -5 '
+                        b'99999999999999999999 99999999999999999999 18446744073709551616')
+    assert sum_of_unique(values) == 1 - 5 + 2 ** 64
+    edges = parse_ints(b'9223372036854775807 9223372036854775806 -9223372036854775808')
+    assert sum_of_unique(edges) == INT64_MAX + INT64_MAX - 1 - 2 ** 63
+
+
+def test_most_frequent_difference():
+    for values in random_lists(3, low=0, high=6):
+        counts = Counter(abs(a - b) for a, b in zip(values, values[1:]))
+        expected = None
+        if counts and max(counts.values()) > 1:
+            best = max(counts.values())
+            expected = next(d for d in counts if counts[d] == best)
+        assert most_frequent_difference(values) == expected
+
+
+def test_vote_winner():
+    for values in random_lists(4, low=0, high=3):
+        counts = Counter(values)
+        top = [v for v in counts if counts[v] == max(counts.values(), default=0)]
+        assert vote_winner(values) == (top[0] if len(top) == 1 else None)
+
+
+# ---------- subarrays and prefix sums ----------
+
+@pytest.mark.parametrize('func, op', [(subarray_ors, operator.or_),
+                                      (subarray_ands, operator.and_),
+                                      (subarray_gcds, math.gcd)])
+def test_subarray_values(func, op):
+    for values in random_lists(5, low=0, high=64):
+        assert func(values) == {reduce(op, sub) for sub in all_subarrays(values)}
+
+
+def test_target_sum_subarrays():
+    for values in random_lists(6):
+        for target in (-2, 0, 3):
+            expected = sorted(((i, j) for i in range(len(values)) for j in range(i, len(values))
+                               if sum(values[i:j + 1]) == target), key=lambda p: (p[1], p[0]))
+            assert target_sum_subarrays(values, target) == expected
+            index = PrefixIndex(values)
+            assert index.count(target) == len(expected)
+            assert index.exists(target) == bool(expected)
+            if expected:
+                longest = max(expected, key=lambda p: (p[1] - p[0], -p[0]))
+                shortest = min(expected, key=lambda p: (p[1] - p[0], p[0]))
+                assert index.longest(target) == longest
+                assert index.shortest(target) == shortest
+            else:
+                assert index.longest(target) is None and index.shortest(target) is None
+        assert has_zero_sum_subarray(values) == any(sum(s) == 0 for s in all_subarrays(values))
+
+
+def test_prefix_sums_beyond_int64():
+    values = [INT64_MAX, INT64_MAX, -INT64_MAX, 1]
+    index = PrefixIndex(values)
+    assert list(index.pairs(INT64_MAX)) == [(0, 0), (1, 1), (0, 2)]
+    assert index.count(0) == 1
+    assert index.longest(1) == (1, 3)
+
+
+# ---------- LIS, palindromes, top-k ----------
+
+def test_lis():
+    for values in random_lists(7):
+        for strict in (True, False):
+            better = operator.lt if strict else operator.le
+            best = [1] * len(values)
+            for j in range(len(values)):
+                for i in range(j):
+                    if better(values[i], values[j]):
+                        best[j] = max(best[j], best[i] + 1)
+            length = max(best, default=0)
+            assert lis_length(values, strict) == length
+            sequence = longest_increasing_subsequence(values, strict)
+            assert len(sequence) == length
+            assert all(better(a, b) for a, b in zip(sequence, sequence[1:]))
+            rest = iter(values)
+            assert all(value in rest for value in sequence)      # a subsequence
+
+
+def random_texts(seed, count=200):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rng.choice('ab') for _ in range(rng.randint(0, 12)))
+
+
+def test_palindromes():
+    for text in random_texts(8):
+        spans = [(i, j) for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+                 if text[i:j] == text[i:j][::-1]]
+        pal = Palindromes(text)
+        assert pal.count() == len(spans)
+        assert list(pal.spans()) == spans
+        assert list(palindromic_substrings(text)) == [text[i:j] for i, j in spans]
+        longest = max((j - i for i, j in spans), default=0)
+        assert len(pal.longest_palindrome()) == longest
+        splits = [(text[:i], text[i:j], text[j:]) for i, j in combinations(range(1, len(text)), 2)
+                  if all(part == part[::-1] for part in (text[:i], text[i:j], text[j:]))]
+        assert three_palindromes(text) == (splits[0] if splits else None)
+
+
+def test_top_k():
+    rng = random.Random(9)
+    for _ in range(100):
+        records = [(rng.randint(0, 5), rng.choice('abc')) for _ in range(rng.randint(0, 20))]
+        for k in (1, 3, 10):
+            key = lambda r: (r[0], Reversed(r[1]))
+            expected = sorted(records, key=key, reverse=True)[:k]
+            assert top_k(records, k, key=key) == expected
+            half = len(records) // 2
+            parts = [top_k(records[:half], k, key=key), top_k(records[half:], k, key=key)]
+            assert [key(r) for r in merge_top_k(parts, k, key=key)] == [key(r) for r in expected]
+
+
+# ---------- primes ----------
+
+def test_primes_in_range():
+    for low, high in ((0, 1), (0, 100), (90, 200), (10 ** 6, 10 ** 6 + 500)):
+        expected = [n for n in range(low, high + 1) if is_prime(n)]
+        assert list(primes_in_range(low, high, segment_size=64)) == expected
+        assert list(digit_sum_primes(low, high, segment_size=64)) == \
+            [p for p in expected if is_prime(sum(map(int, str(p))))]
+
+
+def test_digit_sum():
+    for n in (0, 7, 10, 9999, 10000, -456, 10 ** 30 + 5, -INT64_MAX):
+        assert digit_sum(n) == sum(map(int, str(abs(n))))
+
+
+# ---------- matrices ----------
+
+def test_matrix_sums_beyond_int64():
+    text = b'2 2\n9223372036854775807 9223372036854775807\n9223372036854775807 1\n'
+    matrix = read_matrix(InputReader(io.BytesIO(text)))
+    assert total(matrix) == 3 * INT64_MAX + 1
+    assert diagonal_sums(matrix) == (INT64_MAX + 1, 2 * INT64_MAX)
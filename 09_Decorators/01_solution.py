@@ -1,10 +1,12 @@
-import time 
+import time
+
+from perf_metrics import timed
 
 def timer(func):
     def wrapper(*args,**kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args,**kwargs)
-        end = time.time()
+        end = time.perf_counter()
         print (f"{func.__name__} ran in {end-start} time")
         return result
     return wrapper
@@ -13,4 +15,15 @@ def timer(func):
 def example_function(n):
     time.sleep(n)
 
-example_function(5)
\ No newline at end of file
+example_function(5)
+
+# For functions called many times, aggregate instead of printing every call;
+# run with PK_METRICS_REPORT=1 to see the summary at exit.
+@timed
+def square(n):
+    return n * n
+
+
+if __name__ == "__main__":
+    for i in range(100000):
+        square(i)
@@ -0,0 +1,102 @@
+# Group commit: buffer writes and persist them together.
+#
+# Items pile up until there are `max_items` of them or `max_delay` seconds
+# have passed since the first one, then flush_func(items) persists the whole
+# group in one go (one file write, one transaction). flush() forces it, and
+# anything still buffered is flushed at interpreter exit, so a crash loses at
+# most one window of edits.
+#
+# If flush_func raises, the group goes back to the front of the buffer and
+# is retried by the next flush, so a failed write loses nothing. A flush_func
+# that persisted part of the group raises PartialFlush instead: only the
+# items it names failed, and they are dropped rather than retried forever.
+#
+# A flush started by the timer runs on the timer's thread, where an exception
+# would only be printed. It is kept instead and raised from the next add(),
+# flush() or close(), so the code that queued the group finds out.
+#
+# Used by journal_store.JournalStore and the SQLite VideoStore. Both managers
+# turn it on with YT_GROUP_COMMIT="<count>,<seconds>", e.g. "200,0.5".
+
+import atexit
+import os
+import threading
+
+
+def settings_from_env(name='YT_GROUP_COMMIT'):
+    value = os.environ.get(name)
+    if not value:
+        return None
+    count, _, delay = value.partition(',')
+    return int(count), float(delay or 1.0)
+
+
+class PartialFlush(Exception):
+    # The rest of the group was persisted; `failed` holds (item, exception)
+    # for each item that was not.
+    def __init__(self, failed):
+        super().__init__(f"{len(failed)} item(s) not written: {failed[0][1]}")
+        self.failed = failed
+
+
+class GroupCommit:
+    def __init__(self, flush_func, max_items=100, max_delay=1.0):
+        self.flush_func = flush_func
+        self.max_items = max_items
+        self.max_delay = max_delay
+        # Re-entrant so a caller can hold it around flush() plus its own work
+        # (the journal store does this while rotating its journal).
+        self.lock = threading.RLock()
+        self._items = []
+        self._timer = None
+        self._error = None
+        atexit.register(self.flush)
+
+    def add(self, item):
+        with self.lock:
+            self._raise_error()
+            self._items.append(item)
+            if len(self._items) >= self.max_items:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def __len__(self):
+        with self.lock:
+            return len(self._items)
+
+    def flush(self):
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            items, self._items = self._items, []
+            if items:
+                try:
+                    self.flush_func(items)
+                except PartialFlush:
+                    raise
+                except BaseException:
+                    self._items[:0] = items
+                    raise
+            self._raise_error()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        except Exception as exc:
+            with self.lock:
+                self._error = exc
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            atexit.unregister(self.flush)
@@ -0,0 +1,223 @@
+# Append-only journal storage for the youtube manager.
+#
+# youtube.txt stays a plain JSON list (the snapshot). Every edit is appended
+# to youtube.txt.journal as one JSON line, so an edit costs one small write
+# instead of rewriting the whole catalog. Once the journal grows past
+# compact_threshold bytes it is folded back into the snapshot on a
+# background thread.
+#
+# Compaction renames the active journal to "<journal>.new.<n>", then, before
+# writing the new snapshot, relabels it "<journal>.<crc32 of snapshot>.<n>".
+# On load, "new" journals are always replayed and labelled ones only if their
+# crc still matches youtube.txt, which tells an unfinished compaction apart
+# from one that already replaced the snapshot.
+#
+# With group_commit=(count, seconds) journal lines are buffered and written
+# (and fsynced, if asked) together; see group_commit.py.
+
+import json
+import os
+import threading
+import zlib
+from contextlib import nullcontext
+
+from group_commit import GroupCommit
+from lazy_catalog import LazyCatalog, encode
+
+
+def _crc_of_file(path):
+    crc = 0
+    try:
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                crc = zlib.crc32(chunk, crc)
+    except FileNotFoundError:
+        pass
+    return crc
+
+
+def apply_record(videos, record, factory=None):
+    op = record['op']
+    video = record.get('video')
+    if video is not None and factory:
+        video = factory(video)
+    if op == 'add':
+        videos.append(video)
+    elif op == 'update':
+        videos[record['index']] = video
+    elif op == 'delete':
+        del videos[record['index']]
+    else:
+        raise ValueError(f"Unknown journal op: {op!r}")
+
+
+def replay_journal(videos, path, factory=None):
+    try:
+        file = open(path, 'rb')
+    except FileNotFoundError:
+        return 0
+    good = 0
+    with file:
+        for line in file:
+            # A torn last line means we crashed mid-append; that edit was
+            # never acknowledged, so it is dropped.
+            if not line.endswith(b'\n'):
+                break
+            apply_record(videos, json.loads(line), factory)
+            good += len(line)
+    return good
+
+
+class JournalStore:
+    def __init__(self, path='youtube.txt', factory=None, compact_threshold=4 << 20,
+                 fsync=False, group_commit=None):
+        self.path = path
+        self.factory = factory
+        self.journal_path = path + '.journal'
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._journal = None
+        self._journal_size = 0
+        self._compactor = None
+        self._group = GroupCommit(self._write_lines, *group_commit) if group_commit else None
+
+    def load(self):
+        videos = LazyCatalog(self.path, self.factory)
+
+        recovered = []
+        pending = self._pending_journals()
+        snapshot_crc = _crc_of_file(self.path) if pending else None
+        for tag, seq, path in pending:
+            if tag == 'new' or int(tag, 16) == snapshot_crc:
+                replay_journal(videos, path, self.factory)
+                recovered.append(path)
+            else:
+                os.remove(path)
+        good = replay_journal(videos, self.journal_path, self.factory)
+        if os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > good:
+            os.truncate(self.journal_path, good)
+
+        self._open_journal()
+        if recovered:
+            # Finish the interrupted compaction, folding in whatever was
+            # written to the active journal after it started.
+            self._start_compaction(videos, recovered)
+        return videos
+
+    def _pending_journals(self):
+        folder = os.path.dirname(self.journal_path)
+        prefix = os.path.basename(self.journal_path) + '.'
+        pending = []
+        for name in os.listdir(folder or '.'):
+            if not name.startswith(prefix):
+                continue
+            tag, _, seq = name[len(prefix):].partition('.')
+            pending.append((tag, int(seq or 0), os.path.join(folder, name)))
+        return sorted(pending, key=lambda item: item[1])
+
+    def _open_journal(self):
+        self._journal = open(self.journal_path, 'ab')
+        self._journal_size = self._journal.tell()
+
+    def _write_lines(self, lines):
+        data = b''.join(lines)
+        with self._lock:
+            self._journal.write(data)
+            self._journal.flush()
+            if self.fsync:
+                os.fsync(self._journal.fileno())
+            self._journal_size += len(data)
+
+    def append(self, record, videos=None):
+        line = (json.dumps(record, default=encode) + '\n').encode()
+        if self._group is not None:
+            self._group.add(line)
+        else:
+            self._write_lines([line])
+        with self._lock:
+            should_compact = (videos is not None
+                              and self._journal_size >= self.compact_threshold
+                              and self._compactor is None)
+        if should_compact:
+            self._start_compaction(videos)
+
+    def add(self, videos, video):
+        videos.append(video)
+        self.append({'op': 'add', 'video': video}, videos)
+
+    def update(self, videos, index, video):
+        videos[index] = video
+        self.append({'op': 'update', 'index': index, 'video': video}, videos)
+
+    def delete(self, videos, index):
+        del videos[index]
+        self.append({'op': 'delete', 'index': index}, videos)
+
+    def flush(self):
+        if self._group is not None:
+            self._group.flush()
+
+    def _start_compaction(self, videos, pending=()):
+        # Buffered lines belong to the journal being rotated out: they are
+        # already part of the snapshot taken below.
+        with self._group.lock if self._group else nullcontext():
+            self.flush()
+            self._rotate_and_compact(videos, pending)
+
+    def _rotate_and_compact(self, videos, pending):
+        with self._lock:
+            if self._compactor is not None:
+                return
+            pending = list(pending)
+            if self._journal_size:
+                rotated = f"{self.journal_path}.new.{len(pending)}"
+                self._journal.close()
+                os.replace(self.journal_path, rotated)
+                pending.append(rotated)
+                self._open_journal()
+            snapshot = videos.snapshot() if hasattr(videos, 'snapshot') else list(videos)
+            self._compactor = threading.Thread(
+                target=self._compact, args=(snapshot, pending), daemon=True)
+            self._compactor.start()
+
+    def _compact(self, snapshot, pending):
+        snapshot_crc = _crc_of_file(self.path)
+        labelled = []
+        for seq, path in enumerate(pending):
+            target = f"{self.journal_path}.{snapshot_crc:08x}.{seq}"
+            os.replace(path, target)
+            labelled.append(target)
+
+        if hasattr(snapshot, 'iter_json'):
+            records = snapshot.iter_json()
+        else:
+            records = (json.dumps(video, default=encode).encode() for video in snapshot)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(b'[')
+            for i, record in enumerate(records):
+                if i:
+                    file.write(b', ')
+                file.write(record)
+            file.write(b']')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        for path in labelled:
+            os.remove(path)
+        with self._lock:
+            self._compactor = None
+
+    def wait_for_compaction(self):
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    def close(self):
+        if self._group is not None:
+            self._group.close()
+        self.wait_for_compaction()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,163 @@
+# Lazy, memory-mapped view of youtube.txt.
+#
+# Instead of json.load-ing the whole catalog, the file is mmapped and only an
+# array of record offsets is kept. The offset index is built incrementally,
+# as far as the caller has asked for, and a record is decoded only when it is
+# read. Edited records live in a small overlay list; untouched ones are never
+# copied out of the mapping.
+#
+# Appends made before the file has been scanned to the end (e.g. replaying a
+# journaled 'add' at startup) go to a separate tail, so they don't force a
+# full scan just to find out where the end is. The tail is joined onto the
+# offset index once a scan does reach the end of the file.
+
+import json
+import mmap
+import re
+from array import array
+from collections.abc import MutableSequence
+
+# One flat JSON object, e.g. {"name": "Chai aur Python", "time": "50 min"}.
+# Strings are matched as a whole so braces inside names don't confuse it;
+# the pattern is written as an unrolled loop so it never backtracks badly.
+RECORD = re.compile(rb'\{[^"{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}]*)*\}')
+
+
+def encode(obj):
+    # json.dumps default= hook for record objects such as video.Video.
+    return obj.to_dict()
+
+
+class LazyCatalog(MutableSequence):
+    def __init__(self, path=None, factory=None):
+        self.factory = factory
+        self._mm = None
+        self._offsets = array('q')   # >= 0: offset in the map, < 0: ~overlay slot
+        self._overlay = []
+        self._tail = array('q')      # overlay slots appended past the unscanned end
+        self._scan_pos = 0
+        self._scanned_all = True
+        if path is not None:
+            self._open(path)
+
+    def _open(self, path):
+        try:
+            with open(path, 'rb') as file:
+                self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return
+        except ValueError:
+            # mmap refuses empty files; an empty file is an empty catalog.
+            return
+        self._scanned_all = False
+
+    def _scan(self, upto=None):
+        # Extend the offset index until it holds `upto` records (or all).
+        if self._scanned_all:
+            return
+        offsets = self._offsets
+        for match in RECORD.finditer(self._mm, self._scan_pos):
+            offsets.append(match.start())
+            self._scan_pos = match.end()
+            if upto is not None and len(offsets) >= upto:
+                return
+        self._scanned_all = True
+        offsets.extend(self._tail)
+        self._tail = array('q')
+
+    def _slot(self, index):
+        if index < 0:
+            self._scan()
+            index += len(self._offsets)
+        elif index >= len(self._offsets):
+            self._scan(index + 1)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError('catalog index out of range')
+        return index
+
+    def _raw(self, offset):
+        return RECORD.match(self._mm, offset).group()
+
+    def _decode(self, slot):
+        if slot < 0:
+            return self._overlay[~slot]
+        data = json.loads(self._raw(slot))
+        return self.factory(data) if self.factory else data
+
+    def __len__(self):
+        self._scan()
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._decode(self._offsets[self._slot(index)])
+
+    def __setitem__(self, index, video):
+        index = self._slot(index)
+        slot = self._offsets[index]
+        if slot < 0:
+            self._overlay[~slot] = video
+        else:
+            self._overlay.append(video)
+            self._offsets[index] = ~(len(self._overlay) - 1)
+
+    def __delitem__(self, index):
+        del self._offsets[self._slot(index)]
+
+    def insert(self, index, video):
+        # Only scans as far as index (all of it for a negative index).
+        if index < 0:
+            self._scan()
+        elif index >= len(self._offsets):
+            self._scan(index + 1)
+        self._overlay.append(video)
+        self._offsets.insert(index, ~(len(self._overlay) - 1))
+
+    def append(self, video):
+        # No scan: without the end of the file in the index yet, the record
+        # waits in the tail.
+        self._overlay.append(video)
+        slot = ~(len(self._overlay) - 1)
+        if self._scanned_all:
+            self._offsets.append(slot)
+        else:
+            self._tail.append(slot)
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if i >= len(self._offsets):
+                self._scan(i + 1)
+                if i >= len(self._offsets):
+                    return
+            yield self._decode(self._offsets[i])
+            i += 1
+
+    def iter_json(self):
+        # Encoded records for writing a snapshot; untouched ones are copied
+        # straight from the map without a decode/encode round trip.
+        i = 0
+        while True:
+            if i >= len(self._offsets):
+                self._scan(i + 1)
+                if i >= len(self._offsets):
+                    return
+            slot = self._offsets[i]
+            if slot < 0:
+                yield json.dumps(self._overlay[~slot], default=encode).encode()
+            else:
+                yield self._raw(slot)
+            i += 1
+
+    def snapshot(self):
+        # Cheap frozen copy for background compaction: it shares the read-only
+        # map and finishes scanning on its own.
+        copy = LazyCatalog(factory=self.factory)
+        copy._mm = self._mm
+        copy._offsets = array('q', self._offsets)
+        copy._overlay = list(self._overlay)
+        copy._tail = array('q', self._tail)
+        copy._scan_pos = self._scan_pos
+        copy._scanned_all = self._scanned_all
+        return copy
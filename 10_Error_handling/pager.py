@@ -0,0 +1,84 @@
+# Paged listing shared by youtube_manager.py and yt_manager_db.py.
+#
+# A listing is driven by fetch(offset, limit), which returns at most `limit`
+# rows starting at `offset` (fewer at the end). Only the page on screen is
+# ever fetched, and each page is written to the terminal in one call, so the
+# first screen costs the same no matter how big the catalog is.
+
+import sys
+from itertools import count
+
+PAGE_SIZE = 20
+SEPARATOR = "*" * 70
+
+
+def sequence_fetcher(videos):
+    # fetch() over anything indexable, including the lazy catalog: it stops at
+    # the first IndexError instead of asking for len().
+    def fetch(offset, limit):
+        rows = []
+        for i in range(offset, offset + limit):
+            try:
+                rows.append(videos[i])
+            except IndexError:
+                break
+        return rows
+    return fetch
+
+
+def iter_pages(fetch, page_size=PAGE_SIZE, start=0):
+    for offset in count(start, page_size):
+        rows = fetch(offset, page_size)
+        if not rows:
+            return
+        yield offset, rows
+        if len(rows) < page_size:
+            return
+
+
+def render_page(offset, rows, format_row, numbered=True):
+    if numbered:
+        lines = [f"{index}. {format_row(row)}" for index, row in enumerate(rows, start=offset + 1)]
+    else:
+        lines = [format_row(row) for row in rows]
+    return "\n".join(lines) + "\n"
+
+
+def write_all(fetch, format_row, page_size=PAGE_SIZE, numbered=True, out=None):
+    # Non-interactive listing: every page, one write per page.
+    out = out or sys.stdout
+    for offset, rows in iter_pages(fetch, page_size):
+        out.write(render_page(offset, rows, format_row, numbered))
+    out.flush()
+
+
+def browse(fetch, format_row, page_size=PAGE_SIZE, numbered=True, out=None):
+    out = out or sys.stdout
+    offset = shown = 0
+    while True:
+        rows = fetch(offset, page_size)
+        if not rows and offset:
+            out.write("No videos at that position\n")
+            offset = shown
+            continue
+        shown = offset
+        text = render_page(offset, rows, format_row, numbered) if rows else "No videos\n"
+        out.write(f"\n{SEPARATOR}\n{text}{SEPARATOR}\n")
+        out.flush()
+        command = input("[n]ext, [p]rev, [g]o to <number>, [q]uit: ").strip().lower()
+        if command in ('', 'q'):
+            return
+        elif command == 'n':
+            if len(rows) == page_size:
+                offset += page_size
+        elif command == 'p':
+            offset = max(0, offset - page_size)
+        elif command.startswith('g'):
+            try:
+                index = int(command[1:])
+            except ValueError:
+                out.write("Enter a number after g, e.g. g 120\n")
+                continue
+            offset = max(0, index - 1) // page_size * page_size
+        else:
+            out.write("Invalid Choice\n")
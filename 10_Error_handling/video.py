@@ -0,0 +1,144 @@
+# Compact video records.
+#
+# Video keeps one entry as three slots instead of a dict, with the duration
+# parsed once into seconds. VideoColumns stores a whole catalog column by
+# column: interned name/time strings plus a packed array of seconds, so
+# aggregates like total watch time are one pass over a machine array.
+# Both still read and write the {"name": ..., "time": ...} file format.
+
+import json
+import re
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+UNITS = {
+    's': 1, 'sec': 1, 'secs': 1, 'second': 1, 'seconds': 1,
+    'm': 60, 'min': 60, 'mins': 60, 'minute': 60, 'minutes': 60,
+    'h': 3600, 'hr': 3600, 'hrs': 3600, 'hour': 3600, 'hours': 3600,
+}
+DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)\s*([a-zA-Z]*)')
+UNKNOWN = -1
+
+
+def _intern(value):
+    # Older catalogs may hold numbers (e.g. "time": 50); keep those as they are.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def parse_duration(text):
+    # "50 min" -> 3000, "1 hr 20 min" -> 4800, "1:20:00" -> 4800, "90" -> 90 min.
+    text = str(text).strip().lower()
+    if ':' in text:
+        try:
+            seconds = 0
+            for part in text.split(':'):
+                seconds = seconds * 60 + int(part)
+            return seconds
+        except ValueError:
+            return UNKNOWN
+    total = 0
+    found = False
+    for amount, unit in DURATION_PART.findall(text):
+        if unit and unit not in UNITS:
+            return UNKNOWN
+        total += float(amount) * UNITS.get(unit, 60)
+        found = True
+    return int(total) if found else UNKNOWN
+
+
+class Video:
+    __slots__ = ('name', 'time', 'seconds')
+
+    def __init__(self, name, time, seconds=None):
+        self.name = name
+        self.time = _intern(time)
+        self.seconds = parse_duration(time) if seconds is None else seconds
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data['time'])
+
+    def to_dict(self):
+        return {'name': self.name, 'time': self.time}
+
+    def __eq__(self, other):
+        if not isinstance(other, Video):
+            return NotImplemented
+        return self.name == other.name and self.time == other.time
+
+    def __repr__(self):
+        return f"Video({self.name!r}, {self.time!r})"
+
+
+class VideoColumns:
+    def __init__(self, videos=()):
+        self.names = []
+        self.times = []
+        self.seconds = array('q')
+        for video in videos:
+            self.append(video)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as file:
+            return cls(json.load(file))
+
+    def append(self, video):
+        if isinstance(video, dict):
+            video = Video.from_dict(video)
+        self.names.append(_intern(video.name))
+        self.times.append(video.time)
+        self.seconds.append(video.seconds)
+
+    def __len__(self):
+        return len(self.seconds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = VideoColumns()
+            part.names = self.names[index]
+            part.times = self.times[index]
+            part.seconds = self.seconds[index]
+            return part
+        return Video(self.names[index], self.times[index], self.seconds[index])
+
+    def __setitem__(self, index, video):
+        if isinstance(index, slice):
+            part = VideoColumns(video)
+            self.names[index] = part.names
+            self.times[index] = part.times
+            self.seconds[index] = part.seconds
+            return
+        if isinstance(video, dict):
+            video = Video.from_dict(video)
+        self.names[index] = _intern(video.name)
+        self.times[index] = video.time
+        self.seconds[index] = video.seconds
+
+    def __delitem__(self, index):
+        del self.names[index]
+        del self.times[index]
+        del self.seconds[index]
+
+    def __iter__(self):
+        for name, time, seconds in zip(self.names, self.times, self.seconds):
+            yield Video(name, time, seconds)
+
+    def total_seconds(self):
+        # Durations that couldn't be parsed are stored as -1 and skipped.
+        if numpy is not None:
+            durations = numpy.frombuffer(self.seconds, dtype=numpy.int64)
+            return int(durations[durations > 0].sum())
+        return sum(self.seconds) + self.seconds.count(UNKNOWN)
+
+    def to_dicts(self):
+        return [{'name': name, 'time': time} for name, time in zip(self.names, self.times)]
+
+    def dump(self, path):
+        with open(path, 'w') as file:
+            json.dump(self.to_dicts(), file)
@@ -1,30 +1,29 @@
-import json
+import os
+import sys
+from group_commit import settings_from_env
+from journal_store import JournalStore
+from pager import browse, sequence_fetcher
+from video import Video
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '09_Decorators'))
+from sampling_profiler import profile_from_env
+
+store = JournalStore('youtube.txt', Video.from_dict, group_commit=settings_from_env())
 
 def load_data():
-    try:
-        with open('youtube.txt','r') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        return []
+    return store.load()
 
-def save_data_helper(videos):
-    with open('youtube.txt','w') as file:
-        json.dump(videos,file)
+def format_video(video):
+    return f"{video.name}, Duration: {video.time}"
 
 def list_all_videos(videos):
-    print("\n")
-    print("*" * 70)
-    for index, video in enumerate(videos, start=1):
-        print(f"{index}. {video['name']}, Duration: {video['time']} ")
-    print("\n")
-    print("*" * 70)
+    browse(sequence_fetcher(videos), format_video)
 
 
 def add_video(videos):
     name = input("Enter video name: ")
     time = input("Enter video time: ")
-    videos.append({'name':name,'time':time})
-    save_data_helper(videos)
+    store.add(videos, Video(name, time))
 
 def update_video(videos):
     list_all_videos(videos)
@@ -32,8 +31,7 @@ def update_video(videos):
     if 1 <= index <= len(videos):
         name = input("Enter the new video name")
         time = input("Enter the new video time")
-        videos[index-1] = {'name':name, 'time': time}
-        save_data_helper(videos)
+        store.update(videos, index-1, Video(name, time))
     else:
         print("Invalid index selected")
 
@@ -43,8 +41,7 @@ def delete_video(videos):
     index = int(input("Enter the video number to be deleted"))
     
     if 1<= index <= len(videos):
-        del videos[index-1]
-        save_data_helper(videos)
+        store.delete(videos, index-1)
     else:
         print("Invalid video index selected")
 
@@ -71,9 +68,11 @@ def main():
             case '4':
                 delete_video(videos)
             case '5':
+                store.close()
                 break
             case _:
                 print("Invalid Choice")
 
 if __name__ == "__main__":
+    profile_from_env()
     main()  
\ No newline at end of file
@@ -0,0 +1,215 @@
+# asyncio front end for both video stores.
+#
+#   manager = AsyncVideoManager(SqliteBackend('yt_videos.db'))
+#   # or AsyncVideoManager(JsonBackend('../10_Error_handling/youtube.txt'))
+#   new_id = await manager.add("Chai aur Python", "50 min")
+#   rows = await manager.search("chai")
+#   await manager.close()
+#
+# Every blocking call runs on a small thread pool, and at most
+# `max_pending` jobs may be queued on it at once. Writes that arrive while
+# the loop is busy are coalesced: they are queued, and a single executor job
+# applies the whole batch (one transaction for SQLite, one pass under the
+# lock for JSON). Each caller still awaits its own result: an op that fails
+# is undone on its own (a SAVEPOINT per op for SQLite) and only its caller
+# gets the exception, the rest of the batch is kept.
+#
+# Rows come back as dicts {'id', 'name', 'time'}. For the JSON store the id
+# is the 1-based position, just like the numbers the CLI shows.
+
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10_Error_handling'))
+from journal_store import JournalStore
+from video import Video
+
+from schema import duration_seconds
+from video_store import VideoStore, savepoint
+from yt_manager_db import search_query
+
+
+class JsonBackend:
+    def __init__(self, path='youtube.txt'):
+        self.store = JournalStore(path, Video.from_dict)
+        self._lock = threading.Lock()
+        self._videos = None
+
+    def _catalog(self):
+        if self._videos is None:
+            self._videos = self.store.load()
+        return self._videos
+
+    def list(self, offset, limit):
+        with self._lock:
+            videos = self._catalog()
+            rows = []
+            for i in range(offset, offset + limit):
+                try:
+                    video = videos[i]
+                except IndexError:
+                    break
+                rows.append({'id': i + 1, 'name': video.name, 'time': video.time})
+            return rows
+
+    def search(self, term, prefix, limit):
+        term = term.lower()
+        rows = []
+        with self._lock:
+            for i, video in enumerate(self._catalog()):
+                name = video.name.lower()
+                if name.startswith(term) if prefix else term in name:
+                    rows.append({'id': i + 1, 'name': video.name, 'time': video.time})
+                    if len(rows) == limit:
+                        break
+        return rows
+
+    def apply(self, ops):
+        results = []
+        with self._lock:
+            videos = self._catalog()
+            for op, *args in ops:
+                try:
+                    if op == 'add':
+                        self.store.add(videos, Video(*args))
+                        results.append(len(videos))
+                    elif op == 'update':
+                        video_id, name, time = args
+                        if not 1 <= video_id:
+                            raise IndexError(video_id)
+                        self.store.update(videos, video_id - 1, Video(name, time))
+                        results.append(True)
+                    else:
+                        (video_id,) = args
+                        if not 1 <= video_id:
+                            raise IndexError(video_id)
+                        self.store.delete(videos, video_id - 1)
+                        results.append(True)
+                except IndexError:
+                    results.append(False)
+                except Exception as error:
+                    results.append(error)
+        return results
+
+    def close(self):
+        self.store.close()
+
+
+class SqliteBackend:
+    def __init__(self, db_path='yt_videos.db', readers=4, profile=None):
+        self.store = VideoStore(db_path, readers, profile)
+
+    def list(self, offset, limit):
+        with self.store.reader() as conn:
+            rows = conn.execute("SELECT id, name, time FROM videos ORDER BY id LIMIT ? OFFSET ?",
+                                (limit, offset)).fetchall()
+        return [{'id': id_, 'name': name, 'time': time} for id_, name, time in rows]
+
+    def search(self, term, prefix, limit):
+        with self.store.reader() as conn:
+            rows = conn.execute(*search_query(term, prefix, limit, 0, self.store.has_fts))
+            return [{'id': id_, 'name': name, 'time': time} for id_, name, time in rows]
+
+    def apply(self, ops):
+        # Like JsonBackend.apply, a failing op's result is its exception.
+        results = []
+        with self.store.writer() as conn:
+            for op, *args in ops:
+                try:
+                    with savepoint(conn):
+                        results.append(self._apply_one(conn, op, args))
+                except Exception as error:
+                    results.append(error)
+        return results
+
+    def _apply_one(self, conn, op, args):
+        if op == 'add':
+            name, time = args
+            cursor = conn.execute(
+                "INSERT INTO videos (name, time, duration) VALUES (?, ?, ?)",
+                (name, time, duration_seconds(time)))
+            return cursor.lastrowid
+        if op == 'update':
+            video_id, name, time = args
+            cursor = conn.execute(
+                "UPDATE videos SET name = ?, time = ?, duration = ? WHERE id = ?",
+                (name, time, duration_seconds(time), video_id))
+            return cursor.rowcount > 0
+        (video_id,) = args
+        cursor = conn.execute("DELETE FROM videos WHERE id = ?", (video_id,))
+        return cursor.rowcount > 0
+
+    def close(self):
+        self.store.close()
+
+
+class AsyncVideoManager:
+    def __init__(self, backend, max_workers=4, max_pending=64, max_batch=1000):
+        self.backend = backend
+        self.max_batch = max_batch
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='videos')
+        self._slots = asyncio.Semaphore(max_pending)
+        self._queued = []          # (op tuple, future) waiting for the next batch
+        self._flusher = None
+
+    async def _run(self, func, *args):
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def list(self, offset=0, limit=20):
+        return await self._run(self.backend.list, offset, limit)
+
+    async def search(self, term, prefix=False, limit=20):
+        return await self._run(self.backend.search, term, prefix, limit)
+
+    def _write(self, op):
+        future = asyncio.get_running_loop().create_future()
+        self._queued.append((op, future))
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush())
+        return future
+
+    async def _flush(self):
+        # Let every coroutine that is ready this turn queue its write first.
+        await asyncio.sleep(0)
+        while self._queued:
+            batch, self._queued = self._queued[:self.max_batch], self._queued[self.max_batch:]
+            try:
+                results = await self._run(self.backend.apply, [op for op, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def add(self, name, time):
+        return await self._write(('add', name, time))
+
+    async def add_many(self, videos):
+        return await asyncio.gather(*(self._write(('add', name, time)) for name, time in videos))
+
+    async def update(self, video_id, name, time):
+        return await self._write(('update', int(video_id), name, time))
+
+    async def delete(self, video_id):
+        return await self._write(('delete', int(video_id)))
+
+    async def flush(self):
+        if self._flusher is not None:
+            await self._flusher
+
+    async def close(self):
+        await self.flush()
+        await self._run(self.backend.close)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,69 @@
+# SQLite connection profiles for the video DB.
+#
+#   durable  - rollback journal + synchronous=FULL: sqlite's defaults, every
+#              commit is fsynced before it returns.
+#   balanced - WAL + synchronous=NORMAL: commits survive an app crash, the
+#              last few may be lost on power failure. Readers don't block
+#              the writer.
+#   bulk     - WAL + synchronous=OFF and big caches, for batch imports that
+#              can simply be rerun if the machine goes down.
+#
+# Pick one with YT_DB_PROFILE=<name> or by passing it to apply_profile().
+
+import os
+
+PROFILES = {
+    'durable': {
+        'journal_mode': 'delete',
+        'synchronous': 'FULL',
+        'cache_size': -2_000,          # KiB when negative
+        'mmap_size': 0,
+        'temp_store': 'DEFAULT',
+    },
+    'balanced': {
+        'journal_mode': 'wal',
+        'synchronous': 'NORMAL',
+        'cache_size': -64_000,
+        'mmap_size': 256 << 20,
+        'temp_store': 'MEMORY',
+    },
+    'bulk': {
+        'journal_mode': 'wal',
+        'synchronous': 'OFF',
+        'cache_size': -512_000,
+        'mmap_size': 1 << 30,
+        'temp_store': 'MEMORY',
+    },
+}
+
+SYNCHRONOUS = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+TEMP_STORE = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
+
+DEFAULT_PROFILE = os.environ.get('YT_DB_PROFILE', 'balanced')
+
+
+def apply_profile(conn, name=None):
+    name = name or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown DB profile {name!r}, choose from {', '.join(PROFILES)}")
+    for pragma, value in PROFILES[name].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return name
+
+
+def current_settings(conn):
+    # Read the pragmas back from sqlite rather than trusting what was asked for
+    # (e.g. journal_mode stays 'memory' for :memory: databases).
+    settings = {pragma: conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in PROFILES['durable']}
+    settings['synchronous'] = SYNCHRONOUS.get(settings['synchronous'], settings['synchronous'])
+    settings['temp_store'] = TEMP_STORE.get(settings['temp_store'], settings['temp_store'])
+    return settings
+
+
+def active_profile(conn):
+    settings = current_settings(conn)
+    for name, profile in PROFILES.items():
+        if all(str(settings[key]).lower() == str(value).lower() for key, value in profile.items()):
+            return name
+    return 'custom'
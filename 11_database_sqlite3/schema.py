@@ -0,0 +1,106 @@
+# Schema for the videos DB, shared by yt_manager_db.py and yt_batch.py.
+#
+# Besides the original videos(id, name, time) table this keeps:
+#   * duration  - the `time` text parsed into seconds, with a B-tree index,
+#                 so range filters don't scan the table;
+#   * videos_name - a case-insensitive B-tree index on name for prefix search;
+#   * videos_fts - an FTS5 trigram index over name (external content, kept
+#                 in sync by triggers) for substring search.
+# Older databases are migrated in place the first time they are opened.
+
+import os
+import sqlite3
+import sys
+from functools import lru_cache
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10_Error_handling'))
+from video import UNKNOWN, parse_duration
+
+FTS_TRIGGERS = {
+    'videos_fts_insert': '''
+        create trigger if not exists videos_fts_insert after insert on videos begin
+            insert into videos_fts(rowid, name) values (new.id, new.name);
+        end''',
+    'videos_fts_delete': '''
+        create trigger if not exists videos_fts_delete after delete on videos begin
+            insert into videos_fts(videos_fts, rowid, name) values ('delete', old.id, old.name);
+        end''',
+    'videos_fts_update': '''
+        create trigger if not exists videos_fts_update after update of name on videos begin
+            insert into videos_fts(videos_fts, rowid, name) values ('delete', old.id, old.name);
+            insert into videos_fts(rowid, name) values (new.id, new.name);
+        end''',
+}
+
+
+@lru_cache(maxsize=4096)   # the same few "50 min" strings repeat a lot
+def duration_seconds(time_text):
+    seconds = parse_duration(time_text)
+    return None if seconds == UNKNOWN else seconds
+
+
+def create_schema(conn):
+    conn.execute('''
+        create table if not exists videos(
+                   id INTEGER primary key,
+                   name TEXT not NULL,
+                   time TEXT not NULL,
+                   duration INTEGER
+                   )
+    ''')
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(videos)")]
+    if 'duration' not in columns:
+        with conn:
+            conn.execute("ALTER TABLE videos ADD COLUMN duration INTEGER")
+            conn.create_function('duration_seconds', 1, duration_seconds, deterministic=True)
+            conn.execute("UPDATE videos SET duration = duration_seconds(time)")
+    conn.execute("create index if not exists videos_duration on videos(duration)")
+    conn.execute("create index if not exists videos_name on videos(name collate nocase)")
+
+    has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'videos_fts'").fetchone() is not None
+    if not has_fts:
+        try:
+            with conn:
+                conn.execute('''create virtual table videos_fts using fts5(
+                                    name, content='videos', content_rowid='id',
+                                    tokenize='trigram')''')
+                conn.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            # sqlite built without FTS5 (or < 3.34 without trigram):
+            # searches fall back to LIKE scans.
+            return False
+    for trigger in FTS_TRIGGERS.values():
+        conn.execute(trigger)
+    return True
+
+
+def bulk_insert(conn, rows, has_fts):
+    # executemany() for many (name, time, duration) rows at once. Feeding the
+    # FTS index row by row from the trigger costs ~20x the insert itself, so
+    # the trigger is suspended and the new rows are indexed with one
+    # INSERT ... SELECT. It all happens in one transaction, so the index is
+    # never out of step with the table, even after a crash.
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    last_id = conn.execute("SELECT coalesce(max(id), 0) FROM videos").fetchone()[0]
+    if has_fts:
+        conn.execute("DROP TRIGGER IF EXISTS videos_fts_insert")
+    conn.executemany("INSERT INTO videos (name, time, duration) VALUES (?, ?, ?)", rows)
+    if has_fts:
+        conn.execute("INSERT INTO videos_fts(rowid, name) SELECT id, name FROM videos WHERE id > ?",
+                     (last_id,))
+        conn.execute(FTS_TRIGGERS['videos_fts_insert'])
+
+
+def fts_bulk_mode(conn, on):
+    # FTS5 merges its index segments a little on every write ('automerge'),
+    # so a load of many chunks rewrites the same postings over and over.
+    # Turned on, merging stops; turned off, the default comes back and the
+    # index is merged once with 'optimize'. Each call commits on its own.
+    with conn:
+        if on:
+            conn.execute("INSERT INTO videos_fts(videos_fts, rank) VALUES ('automerge', 0)")
+        else:
+            conn.execute("INSERT INTO videos_fts(videos_fts, rank) VALUES ('automerge', 4)")
+            conn.execute("INSERT INTO videos_fts(videos_fts) VALUES ('optimize')")
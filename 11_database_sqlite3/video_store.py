@@ -0,0 +1,164 @@
+# Thread-safe access to the videos DB.
+#
+# One writer connection (writes are serialized by a lock, as sqlite allows
+# only one writer anyway) and a bounded pool of reader connections. Threads
+# check a connection out for the length of a `with` block; nested checkouts
+# in the same thread reuse the connection they already hold. Nothing is
+# opened until the first checkout, so importing a module that builds a store
+# does not touch the disk.
+#
+# With the WAL profiles from db_profiles.py readers never wait on the writer;
+# under 'durable' they can, up to `timeout` seconds (sqlite's busy timeout).
+#
+# With group_commit=(count, seconds), write() buffers statements and commits
+# them together in one transaction (see 10_Error_handling/group_commit.py).
+# Each statement runs under its own savepoint, so one that fails is reported
+# alone and the valid edits buffered with it are still committed.
+# Readers flush the buffer first, so a thread always sees its own writes.
+#
+# savepoint(conn) wraps part of a transaction so that an error undoes only
+# that part; the batch writers use it to keep one bad statement from
+# rolling back the others.
+
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10_Error_handling'))
+from group_commit import GroupCommit, PartialFlush
+
+from db_profiles import apply_profile
+from schema import create_schema
+
+
+@contextmanager
+def savepoint(conn, name='part'):
+    # A SAVEPOINT outside a transaction would start (and RELEASE commit) one
+    # of its own, so make sure the enclosing transaction is open first.
+    if not conn.in_transaction:
+        conn.execute("BEGIN")
+    conn.execute(f"SAVEPOINT {name}")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute(f"ROLLBACK TO {name}")
+        conn.execute(f"RELEASE {name}")
+        raise
+    conn.execute(f"RELEASE {name}")
+
+
+class VideoStore:
+    def __init__(self, db_path='yt_videos.db', readers=4, profile=None, timeout=30.0,
+                 group_commit=None):
+        self.db_path = db_path
+        self.max_readers = readers
+        self.profile = profile
+        self.timeout = timeout
+        self.has_fts = False
+        self._open_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._writer = None
+        self._readers = queue.LifoQueue()
+        self._reader_count = 0
+        self._all_readers = []
+        self._local = threading.local()
+        self._group = GroupCommit(self._write_batch, *group_commit) if group_commit else None
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+        apply_profile(conn, self.profile)
+        return conn
+
+    def _writer_conn(self):
+        # The writer is opened first because it also creates/migrates the
+        # schema before any reader looks at the tables.
+        with self._open_lock:
+            if self._writer is None:
+                conn = self._connect()
+                self.has_fts = create_schema(conn)
+                self._writer = conn
+        return self._writer
+
+    @contextmanager
+    def writer(self):
+        conn = self._writer_conn()
+        with self._write_lock:
+            if getattr(self._local, 'writing', False):
+                yield conn
+                return
+            self._local.writing = True
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self._local.writing = False
+
+    def _write_batch(self, statements):
+        # Commits every statement that succeeds; the ones that fail are
+        # rolled back to their savepoint and reported in a PartialFlush.
+        failed = []
+        with self.writer() as conn:
+            for statement in statements:
+                try:
+                    with savepoint(conn):
+                        conn.execute(*statement)
+                except sqlite3.Error as error:
+                    failed.append((statement, error))
+        if failed:
+            raise PartialFlush(failed)
+
+    def write(self, sql, params=()):
+        if self._group is None:
+            with self.writer() as conn:
+                conn.execute(sql, params)
+        else:
+            self._group.add((sql, params))
+
+    def flush(self):
+        if self._group is not None:
+            self._group.flush()
+
+    @contextmanager
+    def reader(self):
+        held = getattr(self._local, 'reader', None)
+        if held is not None:
+            yield held
+            return
+        self.flush()
+        self._writer_conn()
+        conn = self._checkout()
+        self._local.reader = conn
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            self._readers.put(conn)
+
+    def _checkout(self):
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        with self._open_lock:
+            if self._reader_count < self.max_readers:
+                self._reader_count += 1
+                conn = self._connect()
+                self._all_readers.append(conn)
+                return conn
+        return self._readers.get()
+
+    def close(self):
+        if self._group is not None:
+            self._group.close()
+        with self._open_lock:
+            for conn in self._all_readers:
+                conn.close()
+            self._all_readers.clear()
+            self._readers = queue.LifoQueue()
+            self._reader_count = 0
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
@@ -0,0 +1,191 @@
+# Bulk import/export for the videos table, without the interactive menu.
+#
+#   python yt_batch.py import videos.csv
+#   python yt_batch.py import videos.jsonl --chunk 100000
+#   python yt_batch.py import ../10_Error_handling/youtube.txt
+#   python yt_batch.py export backup.jsonl
+#
+# Rows go in through executemany() in chunked transactions, so a commit (and
+# its fsync) is paid once per chunk instead of once per row. The search index
+# is merged once after the last chunk rather than a little on every chunk
+# (schema.fts_bulk_mode); that and the index maintenance in SQLite are most
+# of an import's time. Exports stream
+# back out with fetchmany(), so neither direction holds the table in memory.
+# The connection uses the 'bulk' profile from db_profiles.py unless --profile
+# says otherwise.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10_Error_handling'))
+from journal_store import replay_journal
+
+from db_profiles import PROFILES
+from schema import bulk_insert, duration_seconds, fts_bulk_mode
+from video_store import VideoStore
+
+CHUNK = 50_000
+
+
+def guess_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext == '.jsonl':
+        return 'jsonl'
+    return 'json'
+
+
+def read_csv(path):
+    # Rows need a name and a time; others are reported and skipped.
+    with open(path, newline='') as file:
+        reader = csv.reader(file)
+        for i, row in enumerate(reader):
+            if i == 0 and [col.strip().lower() for col in row[:2]] == ['name', 'time']:
+                continue
+            if not row:
+                continue
+            if len(row) < 2:
+                print(f"{path}:{reader.line_num}: skipping row without a time: {row!r}",
+                      file=sys.stderr)
+                continue
+            yield row[0], row[1]
+
+
+def read_jsonl(path):
+    # Like read_csv(): records without a name and a time are reported and
+    # skipped, and so are lines that are not JSON at all.
+    with open(path) as file:
+        for line_num, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                video = json.loads(line)
+            except ValueError:
+                print(f"{path}:{line_num}: skipping line that is not JSON: {line.strip()!r}",
+                      file=sys.stderr)
+                continue
+            try:
+                name, time_ = video['name'], video['time']
+            except (KeyError, TypeError):
+                print(f"{path}:{line_num}: skipping record without a name and time: {video!r}",
+                      file=sys.stderr)
+                continue
+            yield name, time_
+
+
+def read_json(path):
+    # youtube.txt from the JSON manager, with the edits still in its journal.
+    # Both are only read: JournalStore.load() would create a journal or start
+    # a compaction on the file being imported.
+    with open(path) as file:
+        videos = json.load(file)
+    replay_journal(videos, path + '.journal')
+    for video in videos:
+        yield video['name'], video['time']
+
+
+READERS = {'csv': read_csv, 'jsonl': read_jsonl, 'json': read_json}
+
+
+def import_rows(store, rows, chunk=CHUNK):
+    total = 0
+    rows = iter(rows)
+    with store.writer() as conn:
+        if store.has_fts:
+            fts_bulk_mode(conn, True)
+    try:
+        while True:
+            batch = list(islice(rows, chunk))
+            if not batch:
+                return total
+            with store.writer() as conn:
+                bulk_insert(conn, [(name, time_, duration_seconds(time_))
+                                   for name, time_ in batch], store.has_fts)
+            total += len(batch)
+    finally:
+        if store.has_fts:
+            with store.writer() as conn:
+                fts_bulk_mode(conn, False)
+
+
+def export_rows(store, chunk=CHUNK):
+    with store.reader() as conn:
+        cursor = conn.execute("SELECT name, time FROM videos ORDER BY id")
+        while True:
+            batch = cursor.fetchmany(chunk)
+            if not batch:
+                return
+            yield from batch
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['name', 'time'])
+        writer.writerows(rows)
+
+
+def write_jsonl(path, rows):
+    with open(path, 'w') as file:
+        for name, time_ in rows:
+            file.write(json.dumps({'name': name, 'time': time_}) + '\n')
+
+
+def write_json(path, rows):
+    with open(path, 'w') as file:
+        file.write('[')
+        for i, (name, time_) in enumerate(rows):
+            if i:
+                file.write(', ')
+            file.write(json.dumps({'name': name, 'time': time_}))
+        file.write(']')
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'json': write_json}
+
+
+def report(action, count, seconds):
+    rate = count / seconds if seconds else float('inf')
+    print(f"{action} {count} rows in {seconds:.2f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import/export for yt_videos.db")
+    parser.add_argument('--db', default='yt_videos.db')
+    parser.add_argument('--chunk', type=int, default=CHUNK, help="rows per transaction / fetch")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='bulk')
+    sub = parser.add_subparsers(dest='command', required=True)
+    for command in ('import', 'export'):
+        cmd = sub.add_parser(command)
+        cmd.add_argument('path')
+        cmd.add_argument('--format', choices=sorted(READERS))
+    args = parser.parse_args(argv)
+
+    fmt = args.format or guess_format(args.path)
+    store = VideoStore(args.db, readers=1, profile=args.profile)
+    start = time.perf_counter()
+    if args.command == 'import':
+        count = import_rows(store, READERS[fmt](args.path), args.chunk)
+        report("Imported", count, time.perf_counter() - start)
+    else:
+        count = 0
+
+        def counted(rows):
+            nonlocal count
+            for row in rows:
+                count += 1
+                yield row
+
+        WRITERS[fmt](args.path, counted(export_rows(store, args.chunk)))
+        report("Exported", count, time.perf_counter() - start)
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
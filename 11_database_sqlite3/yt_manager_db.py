@@ -1,34 +1,111 @@
-import sqlite3
+import os
+import sys
+import time
 
-conn = sqlite3.connect('yt_videos.db')
+from db_profiles import active_profile, current_settings
 
-cursor = conn.cursor()
+# The pager lives next to the JSON version of this app.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10_Error_handling'))
+from group_commit import settings_from_env
+from pager import browse
+from schema import duration_seconds
+from video_store import VideoStore
 
-cursor.execute(''' 
-    create table if not exists videos(
-               id INTEGER primary key,
-               name TEXT not NULL,
-               time TEXT not NULL
-               )
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '09_Decorators'))
+from sampling_profiler import profile_from_env
 
-''')
+# Connections open on first use, so importing this module touches no files.
+store = VideoStore('yt_videos.db', group_commit=settings_from_env())
+
+def fetch_videos(offset, limit):
+    with store.reader() as conn:
+        return conn.execute("SELECT id, name, time FROM videos ORDER BY id LIMIT ? OFFSET ?",
+                            (limit, offset)).fetchall()
+
+def format_row(row):
+    return f"ID {row[0]}: {row[1]}, Duration: {row[2]}"
 
 def list_videos():
-    cursor.execute("SELECT * FROM videos")
-    for row in cursor.fetchall():
-        print(row)
+    browse(fetch_videos, format_row, numbered=False)
+
+def escape_like(text):
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def search_videos(term, prefix=False, limit=-1, offset=0):
+    # Case-insensitive name search. A prefix walks the videos_name index;
+    # a substring of 3+ chars goes through the trigram index, shorter ones
+    # (or a sqlite without FTS5) fall back to a LIKE scan.
+    with store.reader() as conn:
+        return conn.execute(*search_query(term, prefix, limit, offset, store.has_fts)).fetchall()
+
+def search_query(term, prefix, limit, offset, has_fts):
+    if prefix:
+        return ('''
+            SELECT id, name, time FROM videos WHERE name LIKE ? ESCAPE '\\'
+            ORDER BY name COLLATE NOCASE LIMIT ? OFFSET ?''',
+            (escape_like(term) + '%', limit, offset))
+    if has_fts and len(term) >= 3:
+        return ('''
+            SELECT v.id, v.name, v.time FROM videos_fts
+            JOIN videos v ON v.id = videos_fts.rowid
+            WHERE videos_fts MATCH ? ORDER BY videos_fts.rowid LIMIT ? OFFSET ?''',
+            ('"' + term.replace('"', '""') + '"', limit, offset))
+    return ('''
+            SELECT id, name, time FROM videos WHERE name LIKE ? ESCAPE '\\'
+            ORDER BY id LIMIT ? OFFSET ?''',
+            ('%' + escape_like(term) + '%', limit, offset))
+
+def videos_by_duration(min_seconds, max_seconds, limit=-1, offset=0):
+    with store.reader() as conn:
+        return conn.execute('''
+            SELECT id, name, time FROM videos WHERE duration BETWEEN ? AND ?
+            ORDER BY duration, id LIMIT ? OFFSET ?''',
+            (min_seconds, max_seconds, limit, offset)).fetchall()
 
+# op name -> [count, total seconds, last seconds], commit included
+write_latency = {}
+
+def track_latency(func):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        stats = write_latency.setdefault(func.__name__, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = elapsed
+        return result
+    return wrapper
+
+@track_latency
 def add_video(name, time):
-    cursor.execute("INSERT INTO videos (name, time) VALUES (?, ?)", (name, time))
-    conn.commit()
+    store.write("INSERT INTO videos (name, time, duration) VALUES (?, ?, ?)",
+                (name, time, duration_seconds(time)))
 
+@track_latency
 def update_video(video_id, new_name, new_time):
-    cursor.execute("UPDATE videos SET name = ?, time = ? WHERE id = ?", (new_name, new_time, video_id))
-    conn.commit()
+    store.write("UPDATE videos SET name = ?, time = ?, duration = ? WHERE id = ?",
+                (new_name, new_time, duration_seconds(new_time), video_id))
 
+@track_latency
 def delete_video(video_id):
-    cursor.execute("DELETE FROM videos where id = ?", (video_id,))
-    conn.commit()
+    store.write("DELETE FROM videos where id = ?", (video_id,))
+
+def show_profile():
+    with store.reader() as conn:
+        print(f"Active profile: {active_profile(conn)}")
+        for pragma, value in current_settings(conn).items():
+            print(f"  {pragma} = {value}")
+    for op, (count, total, last) in write_latency.items():
+        print(f"  {op}: {count} calls, avg {total / count * 1000:.2f} ms, last {last * 1000:.2f} ms")
+
+def ask_minutes(prompt):
+    # Asks again until the answer is a whole number; returns seconds.
+    while True:
+        try:
+            return int(input(prompt)) * 60
+        except ValueError:
+            print("Enter a whole number of minutes, e.g. 30")
 
 
 def main():
@@ -39,6 +116,10 @@ def main():
         print("3. Update Videos")
         print("4. Delete Videos")
         print("5. exit app")
+        print("6. Show DB profile and write latency")
+        print("7. Search videos by name prefix")
+        print("8. Search videos by name containing text")
+        print("9. Find videos by duration range")
         choice = input("Enter your choice: ")
 
         if choice == '1':
@@ -57,12 +138,25 @@ def main():
             delete_video(video_id)
         elif choice == '5':
             break
+        elif choice == '6':
+            show_profile()
+        elif choice in ('7', '8'):
+            term = input("Enter search text: ")
+            prefix = choice == '7'
+            browse(lambda offset, limit: search_videos(term, prefix, limit, offset),
+                   format_row, numbered=False)
+        elif choice == '9':
+            low = ask_minutes("Minimum duration in minutes: ")
+            high = ask_minutes("Maximum duration in minutes: ")
+            browse(lambda offset, limit: videos_by_duration(low, high, limit, offset),
+                   format_row, numbered=False)
         else:
             print("Invalid Choice ")
 
-    conn.close()
+    store.close()
 
 
 
 if __name__== "__main__":
+    profile_from_env()
     main()
\ No newline at end of file
@@ -0,0 +1,534 @@
+# Scaling benchmarks for the practice solvers in 08_Python_practice*.
+#
+#   python benchmarks/bench_solvers.py                 # run all, compare to baselines
+#   python benchmarks/bench_solvers.py QDay3 08_QP     # only scripts matching these
+#   python benchmarks/bench_solvers.py --save          # record new baselines
+#
+# Each solver is run as a real subprocess (stdin from a file, stdout to
+# /dev/null), the way it is used, on seeded random inputs of growing size n:
+# n doubles until one run takes longer than --budget seconds. Times are the
+# child's CPU time; interpreter startup is measured once and subtracted, and
+# each size keeps the best of --repeat runs. A least-squares fit of
+# log(time) against log(input elements) gives the empirical exponent
+# (time ~ m^k, m = n for most scripts and n^2 for the n x n matrix ones),
+# and the fit is used to estimate the largest n that still runs within one
+# second. Each script also pays a fixed cost per run that startup does not
+# cover (imports, reading stdin); the smallest sizes show only that floor,
+# so the fit leaves out runs under FIT_ABOVE times the fastest one and
+# subtracts the floor from the rest.
+#
+# Baselines (baselines.json next to this file) keep the exponent and the
+# timings per solver, together with a calibration time for a fixed pure
+# Python loop so timings from a slower or faster machine are scaled before
+# comparing. A solver is flagged as a regression when it got more than
+# --tolerance slower at the sizes both runs share, or when its exponent grew
+# by more than 0.3; the exit status is then 1.
+#
+# Scripts with a fixed-size input (08_QDay2, 14_QDay3, 02_Q, 04_Q, 10_QP,
+# 11_QP) and the empty 45_QDay5 are not benchmarked: there is nothing to
+# scale.
+
+import argparse
+import json
+import math
+import os
+import random
+import resource
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+MIN_TIME = 0.02        # net seconds; shorter runs are mostly noise and are not fitted
+FIT_ABOVE = 3          # fit and compare only runs this many times above the floor
+SEED = 2024
+
+# script path -> (generator, sizes, dims); generator(rng, n) returns the
+# stdin text, which holds about n ** dims elements
+PROBLEMS = {}
+
+
+def problem(script, start=1000, limit=10 ** 7, sizes=None, dims=1):
+    def register(generator):
+        if sizes is not None:
+            steps = list(sizes)
+        else:
+            steps = []
+            n = start
+            while n <= limit:
+                steps.append(n)
+                n *= 2
+        PROBLEMS[script] = (generator, steps, dims)
+        return generator
+    return register
+
+
+# ---------- input helpers ----------
+
+def ints(rng, n, low=-10 ** 6, high=10 ** 6):
+    return ' '.join(str(rng.randint(low, high)) for _ in range(n))
+
+
+def letters(rng, n, alphabet=string.ascii_lowercase):
+    return ''.join(rng.choices(alphabet, k=n))
+
+
+def words(rng, n, alphabet=string.ascii_lowercase, shortest=1, longest=8):
+    return ' '.join(letters(rng, rng.randint(shortest, longest), alphabet) for _ in range(n))
+
+
+def digits(rng, n):
+    return str(rng.randint(1, 9)) + letters(rng, n - 1, string.digits)
+
+
+def matrix(rng, side):
+    rows = '\n'.join(ints(rng, side) for _ in range(side))
+    return f"{side} {side}\n{rows}\n"
+
+
+# ---------- 08_Python_practice_02 ----------
+
+P2 = '08_Python_practice_02/'
+
+
+@problem(P2 + '01_QDay1.py')
+def majority_input(rng, n):
+    return ints(rng, n, 1, 100) + '\n'
+
+
+@problem(P2 + '02_QDay1.py')
+def unique_sum_input(rng, n):
+    return ints(rng, n, 1, n) + '\n'
+
+
+@problem(P2 + '03_QDay1.py')
+def missing_number_input(rng, n):
+    numbers = list(range(1, n + 1))
+    numbers.remove(rng.randint(1, n))
+    rng.shuffle(numbers)
+    return f"{n}\n{' '.join(map(str, numbers))}\n"
+
+
+@problem(P2 + '04_QDay1.py')
+def fizz_buzz_input(rng, n):
+    return f"{n}\n{ints(rng, n, 1, 10 ** 6)}\n"
+
+
+@problem(P2 + '05_QDay1.py', start=1000, limit=4 * 10 ** 6)
+def top_k_input(rng, n):
+    rows = '\n'.join(f"{rng.randint(0, 100)} {letters(rng, 6)}" for _ in range(n))
+    return f"{min(10, n)} {n}\n{rows}\n"
+
+
+@problem(P2 + '06_QDay1.py')
+def char_threshold_input(rng, n):
+    return f"{letters(rng, n)}\n1\n"
+
+
+@problem(P2 + '07_QDay1.py')
+def armstrong_input(rng, n):
+    return ints(rng, n, 1, 10 ** 6) + '\n'
+
+
+@problem(P2 + '09_QDay2.py', start=64, limit=4096)
+def product_sum_input(rng, n):
+    # int() refuses more than 4300 digits by default
+    return digits(rng, n) + '\n'
+
+
+@problem(P2 + '10_QDay2.py', start=1000, limit=10 ** 7)
+def digit_prime_input(rng, n):
+    return f"1 {n}\n"
+
+
+@problem(P2 + '11_QDay3.py', start=32, limit=8192)
+def unique_paths_input(rng, n):
+    return f"{n} {n}\n"
+
+
+@problem(P2 + '12_QDay3.py', start=1000, limit=10 ** 8)
+def cube_sum_input(rng, n):
+    return f"1 {n}\n"
+
+
+@problem(P2 + '13_QDay3.py')
+def sales_stats_input(rng, n):
+    return f"{n}\n{ints(rng, n, 1, 10 ** 6)}\n"
+
+
+@problem(P2 + '15_QDay3.py', start=100, limit=10 ** 6)
+def subarray_or_input(rng, n):
+    return f"{n}\n{ints(rng, n, 0, 2 ** 20)}\n"
+
+
+@problem(P2 + '15_QDay3_Extra.py', start=8, limit=2048)
+def print_subarrays_input(rng, n):
+    return ints(rng, n, 0, 99) + '\n'
+
+
+@problem(P2 + '16_QDay3.py', start=10 ** 4, limit=10 ** 8)
+def swapcase_input(rng, n):
+    return letters(rng, n, string.ascii_letters) + '\n'
+
+
+@problem(P2 + '17_QDay3.py')
+def shift_input(rng, n):
+    return f"{letters(rng, n, string.ascii_letters + string.digits)}\n{rng.randint(1, 100)}\n"
+
+
+@problem(P2 + '18_QDay3.py')
+def sort_words_input(rng, n):
+    return words(rng, n) + '\n'
+
+
+@problem(P2 + '19_QDay3.py', start=10 ** 4, limit=10 ** 8)
+def ascii_average_input(rng, n):
+    return letters(rng, n) + '\n'
+
+
+@problem(P2 + '20_QDay3.py', start=10 ** 4, limit=10 ** 8)
+def missing_letters_input(rng, n):
+    return letters(rng, n, 'abcdefghijklmnopqrstuvwxy ,.') + '\n'
+
+
+@problem(P2 + '21_QDay3.py', start=10 ** 4, limit=10 ** 8)
+def palindrome_check_input(rng, n):
+    half = letters(rng, n // 2)
+    return half + half[::-1] + '\n'
+
+
+@problem(P2 + '22_QDay3.py')
+def anagram_input(rng, n):
+    text = letters(rng, n)
+    return f"{text}\n{''.join(rng.sample(text, len(text)))}\n"
+
+
+@problem(P2 + '23_QDay3.py', start=16, limit=4096)
+def count_palindromes_input(rng, n):
+    return letters(rng, n, 'ab') + '\n'
+
+
+@problem(P2 + '24_QDay3.py')
+def run_length_input(rng, n):
+    runs = []
+    size = 0
+    while size < n:
+        run = rng.choice(string.ascii_lowercase) * rng.randint(1, 5)
+        runs.append(run)
+        size += len(run)
+    return ''.join(runs) + '\n'
+
+
+@problem(P2 + '25_QDay3.py')
+def longest_word_input(rng, n):
+    return words(rng, n) + '\n'
+
+
+@problem(P2 + '26_QDay3.py')
+def longest_palindromic_word_input(rng, n):
+    return words(rng, n, 'ab', 1, 6) + '\n'
+
+
+@problem(P2 + '27_QDay3.py')
+def reverse_sentence_input(rng, n):
+    return words(rng, n) + '\n'
+
+
+@problem(P2 + '28_QDay4.py')
+def char_frequency_input(rng, n):
+    return letters(rng, n, string.ascii_letters + '    ') + '\n'
+
+
+@problem(P2 + '29_QDay4.py', start=100, limit=10 ** 6)
+def target_sum_input(rng, n):
+    return f"{ints(rng, n, -10, 10)}\n5\n"
+
+
+@problem(P2 + '30_QDay4.py')
+def zero_sum_input(rng, n):
+    # all positive: there is no zero-sum subarray, so the whole array is read
+    return ints(rng, n, 1, 10 ** 6) + '\n'
+
+
+@problem(P2 + '31_QDay4_IMP.py')
+def data_query_input(rng, n):
+    return ''.join(f"{letters(rng, 6)} {rng.randint(15, 30)} {rng.choice(('male', 'female'))} "
+                   f"{rng.uniform(0, 100):.1f}\n" for _ in range(n))
+
+
+@problem(P2 + '32_QDay1.py')
+def height_difference_input(rng, n):
+    return f"{n}\n{ints(rng, n, 0, 1000)}\n"
+
+
+@problem(P2 + '33_QDay4.py', start=16, limit=1024)   # 1024! has ~2600 digits
+def permutation_count_input(rng, n):
+    return letters(rng, n, string.ascii_uppercase) + '\n'
+
+
+@problem(P2 + '33_QDay4_next.py', sizes=range(3, 10))
+def permutations_input(rng, n):
+    return letters(rng, n, string.ascii_uppercase) + '\n'
+
+
+@problem(P2 + '34_QDay4.py')
+def dedupe_words_input(rng, n):
+    return words(rng, n, 'abcde', 1, 6) + '\n'
+
+
+@problem(P2 + '35_QDay4.py')
+def unique_sum_again_input(rng, n):
+    return ints(rng, n, 1, n) + '\n'
+
+
+@problem(P2 + '36_QDay4.py')
+def std_dev_input(rng, n):
+    return ints(rng, n) + '\n'
+
+
+@problem(P2 + '37_QDay4.py', start=64, limit=2048)
+def lcm_input(rng, n):
+    return f"{digits(rng, n)} {digits(rng, n)}\n"
+
+
+@problem(P2 + '38_QDay4.py')
+def votes_input(rng, n):
+    names = [letters(rng, 6) for _ in range(50)]
+    return f"{len(names)} 1\n{' '.join(rng.choice(names) for _ in range(n))}\n"
+
+
+# Matrix problems: n is the side of an n x n matrix (n^2 numbers of input).
+for script in ('39_QDay5.py', '40_QDay5.py', '41_QDay5.py', '42_QDay5.py',
+               '43_QDay5.py', '44_QDay5.py'):
+    problem(P2 + script, start=32, limit=4096, dims=2)(matrix)
+
+
+# ---------- 08_Python_practice ----------
+
+P1 = '08_Python_practice/'
+
+
+@problem(P1 + '01_Q.py', start=1000, limit=10 ** 8)
+def cube_sum_range_input(rng, n):
+    return f"1 {n}\n"
+
+
+@problem(P1 + '03_Q.py', start=100, limit=10 ** 6)
+def item_sales_input(rng, n):
+    items = [letters(rng, 5) for _ in range(100)]
+    rows = '\n'.join(f"{rng.choice(items)} {rng.randint(1, 20)} {rng.randint(1, 500)}"
+                     for _ in range(n))
+    return f"{n}\n{rows}\n"
+
+
+@problem(P1 + '04_QP.py', start=1000, limit=10 ** 7)
+def prime_digit_sum_input(rng, n):
+    return f"1 {n}\n"
+
+
+@problem(P1 + '05_Q.py')
+def split_input(rng, n):
+    return words(rng, n) + '\n'
+
+
+@problem(P1 + '08_QP.py', start=100, limit=10 ** 6)
+def lis_input(rng, n):
+    return f"{n}\n{ints(rng, n)}\n"
+
+
+@problem(P1 + '09_QP.py', start=16, limit=10 ** 5)
+def three_palindromes_input(rng, n):
+    return letters(rng, n, 'ab') + '\n'
+
+
+# ---------- running and fitting ----------
+
+def cpu_time_of_children():
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_once(script, input_path, timeout):
+    # CPU time of the child rather than wall time: on a shared or throttled
+    # machine wall time jumps in scheduler-sized steps.
+    with open(input_path, 'rb') as stdin:
+        start = cpu_time_of_children()
+        subprocess.run([sys.executable, script], stdin=stdin, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, cwd=os.path.dirname(script),
+                       timeout=timeout, check=True)
+        return cpu_time_of_children() - start
+
+
+def startup_time(repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        script = os.path.join(tmp, 'empty.py')
+        stdin = os.path.join(tmp, 'input.txt')
+        open(script, 'w').close()
+        open(stdin, 'w').close()
+        return min(run_once(script, stdin, 60) for _ in range(max(repeat, 5)))
+
+
+def calibrate():
+    # A fixed pure Python workload, used to scale timings between machines.
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        total = 0
+        for i in range(300000):
+            total += i * i % 7
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(script, options, startup, log):
+    generator, sizes, _ = PROBLEMS[script]
+    path = os.path.join(ROOT, script)
+    times = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = os.path.join(tmp, 'input.txt')
+        for n in sizes:
+            rng = random.Random(f"{script}:{n}:{options.seed}")
+            with open(input_path, 'w') as file:
+                file.write(generator(rng, n))
+            try:
+                best = min(run_once(path, input_path, options.budget * 20)
+                           for _ in range(options.repeat))
+            except subprocess.TimeoutExpired:
+                log(f"  n={n}: timed out")
+                break
+            except subprocess.CalledProcessError as error:
+                log(f"  n={n}: exited with status {error.returncode}")
+                break
+            net = round(max(best - startup, 0.0), 6)
+            times[n] = net
+            log(f"  n={n:>10}  {net:9.4f}s")
+            if net > options.budget:
+                break
+    return times
+
+
+def fitted(times):
+    # (floor, sizes worth fitting): the fastest run stands in for the fixed
+    # per-run cost, and only runs well above it say anything about growth.
+    if not times:
+        return 0.0, []
+    floor = min(times.values())
+    limit = max(MIN_TIME, FIT_ABOVE * floor)
+    return floor, [n for n, t in times.items() if t >= limit]
+
+
+def fit_exponent(times, dims=1):
+    # k in time ~ (n ** dims) ** k, or None with fewer than two usable runs
+    floor, sizes = fitted(times)
+    points = [(dims * math.log(n), math.log(times[n] - floor)) for n in sizes]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def n_within(times, exponent, dims=1, seconds=1.0):
+    # Largest n expected to run in `seconds`, extrapolated from the biggest run.
+    if exponent is None or exponent <= 0.05 or not times:
+        return None
+    n, t = max(times.items())
+    if t < MIN_TIME:
+        return None
+    return int(n * (seconds / t) ** (1 / (exponent * dims)))
+
+
+def compare(script, result, baseline, scale, tolerance):
+    old = baseline.get('solvers', {}).get(script)
+    if old is None:
+        return 'new'
+    dims = PROBLEMS[script][2]
+    old_times = {int(n): t for n, t in old['times'].items()}
+    # Both exponents from the same fit, so baselines saved before it changed
+    # still compare; sizes near either run's floor are left out of the ratio.
+    old_exponent = fit_exponent(old_times, dims)
+    shared = set(fitted(old_times)[1]) & set(fitted(result['times'])[1])
+    ratios = sorted(result['times'][n] / (old_times[n] * scale) for n in shared)
+    if old_exponent is not None and result['exponent'] is not None \
+            and result['exponent'] > old_exponent + 0.3:
+        return f"REGRESSION (n^{old_exponent:.2f} -> n^{result['exponent']:.2f})"
+    if not ratios:
+        return 'ok'
+    ratio = ratios[len(ratios) // 2]
+    if ratio > 1 + tolerance:
+        return f"REGRESSION ({ratio:.2f}x slower)"
+    if ratio < 1 / (1 + tolerance):
+        return f"faster ({1 / ratio:.2f}x)"
+    return 'ok'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for the practice solvers.")
+    parser.add_argument('only', nargs='*', help="run scripts whose path contains any of these")
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help="stop growing n once a run takes this many seconds")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per size, best is kept")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help="allowed slowdown before flagging a regression (0.5 = 50%%)")
+    parser.add_argument('--baselines', default=BASELINES)
+    parser.add_argument('--save', action='store_true', help="write the results as new baselines")
+    parser.add_argument('--quiet', action='store_true', help="only print the summary")
+    options = parser.parse_args()
+
+    log = (lambda text: None) if options.quiet else (lambda text: print(text, flush=True))
+    scripts = [s for s in PROBLEMS if not options.only or any(o in s for o in options.only)]
+    if not scripts:
+        sys.exit("no solver matches " + ' '.join(options.only))
+
+    baseline = {}
+    if os.path.exists(options.baselines):
+        with open(options.baselines) as file:
+            baseline = json.load(file)
+    calibration = calibrate()
+    scale = calibration / baseline['calibration'] if baseline.get('calibration') else 1.0
+    startup = startup_time(options.repeat)
+    log(f"interpreter startup {startup * 1000:.1f} ms, machine speed x{1 / scale:.2f} of baseline")
+
+    results = {}
+    for script in scripts:
+        log(script)
+        times = measure(script, options, startup, log)
+        results[script] = {'exponent': fit_exponent(times, PROBLEMS[script][2]), 'times': times}
+
+    print(f"\n{'solver':<40} {'exponent':>9} {'max n':>10} {'n in 1s':>10}  status")
+    regressions = 0
+    for script, result in results.items():
+        exponent = result['exponent']
+        status = compare(script, result, baseline, scale, options.tolerance)
+        regressions += status.startswith('REGRESSION')
+        within = n_within(result['times'], exponent, PROBLEMS[script][2])
+        print(f"{script:<40} {'-' if exponent is None else f'n^{exponent:.2f}':>9} "
+              f"{max(result['times'], default=0):>10} {within or '-':>10}  {status}")
+
+    if options.save:
+        # Keep one calibration for the whole file: new timings are stored in
+        # the units of the machine the existing baselines came from.
+        solvers = baseline.get('solvers', {})
+        for script, result in results.items():
+            times = {n: round(t / scale, 6) for n, t in result['times'].items()}
+            solvers[script] = {'exponent': result['exponent'], 'times': times}
+        with open(options.baselines, 'w') as file:
+            json.dump({'calibration': baseline.get('calibration', calibration),
+                       'python': sys.version.split()[0],
+                       'solvers': dict(sorted(solvers.items()))}, file, indent=1)
+            file.write('\n')
+        print(f"\nbaselines written to {options.baselines}")
+    if regressions:
+        print(f"\n{regressions} regression(s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()